@@ -1,17 +1,32 @@
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, request, jsonify, render_template_string, Response, stream_with_context
 from flask_cors import CORS
 import os
 import json
-import requests
-import feedparser
-from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+import copy
+from datetime import datetime
 import re
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import aiohttp
 import uuid
 from dataclasses import dataclass
 
+from feed_ingestion import search_news, iter_source_articles, rank_articles, feed_poller, article_store, breaker_states
+from news_sources import get_sources, SIDE_KEYWORDS
+from article_dedup import deduplicate_articles, content_hash
+from http_client import http_client
+from article_content import fetch_article_content, prefetch_article_contents
+from content_cache import content_cache
+from extraction_profiles import extraction_profiles
+from extraction_pool import extraction_pool
+from domain_limiter import domain_limiter
+from content_condenser import condense_text, estimate_tokens, TOOL_CONTENT_TOKEN_BUDGET
+from gemini_cache import gemini_response_cache, response_key
+from contradiction_cache import contradiction_cache, pair_key
+from gemini_limiter import (gemini_limiter, GeminiError, classify_error, backoff_delay, GEMINI_MAX_ATTEMPTS,
+                            GEMINI_OUTPUT_TOKEN_ALLOWANCE, GEMINI_MAX_OUTPUT_TOKENS)
+
 # Import smolagents components
 from smolagents import CodeAgent, tool
 
@@ -99,6 +114,10 @@ class A2AProtocol:
 a2a_protocol = A2AProtocol()
 
 
+# Keep every registered source warm in the article store
+feed_poller.add_sources(get_sources())
+
+
 @tool
 def search_western_media_news(query: str = "Gaza Israel", hours_back: int = 24) -> list:
     """
@@ -113,54 +132,10 @@ def search_western_media_news(query: str = "Gaza Israel", hours_back: int = 24)
     """
     print(f"🔍 Searching Western media for: '{query}' (last {hours_back} hours)")
     
-    western_sources = {
-        "CNN": "http://rss.cnn.com/rss/edition.rss",
-        "BBC": "http://feeds.bbci.co.uk/news/world/middle_east/rss.xml",
-        "Reuters": "https://feeds.reuters.com/reuters/worldNews",
-        "AP News": "https://feeds.apnews.com/rss/apf-topnews",
-        "Guardian": "https://www.theguardian.com/world/middleeast/rss",
-        "Washington Post": "https://feeds.washingtonpost.com/rss/world",
-        "New York Times": "https://rss.nytimes.com/services/xml/rss/nyt/World.xml"
-    }
-    
-    all_articles = []
-    cutoff_time = datetime.now() - timedelta(hours=hours_back)
-    
-    for source_name, rss_url in western_sources.items():
-        try:
-            print(f"  📰 Fetching {source_name}...")
-            feed = feedparser.parse(rss_url)
-            
-            for entry in feed.entries[:10]:
-                title_text = entry.get('title', '').lower()
-                summary_text = entry.get('summary', '').lower()
-                
-                if any(keyword in title_text or keyword in summary_text 
-                      for keyword in query.lower().split()):
-                    
-                    pub_date = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        pub_date = datetime(*entry.published_parsed[:6])
-                    
-                    if pub_date and pub_date >= cutoff_time:
-                        all_articles.append({
-                            'title': entry.get('title', 'No title'),
-                            'url': entry.get('link', ''),
-                            'source': source_name,
-                            'summary': entry.get('summary', 'No summary')[:500],
-                            'published': pub_date.isoformat(),
-                            'category': 'western_media'
-                        })
-                        
-            print(f"    ✅ Found articles from {source_name}")
-            
-        except Exception as e:
-            print(f"    ❌ Error with {source_name}: {e}")
-            continue
+    all_articles = search_news(get_sources('western'), query, hours_back, SIDE_KEYWORDS['western'])
     
-    all_articles.sort(key=lambda x: x['published'], reverse=True)
     print(f"✅ Found {len(all_articles)} Western media articles")
-    return all_articles[:10]
+    return all_articles
 
 
 @tool
@@ -177,54 +152,10 @@ def search_arabic_media_news(query: str = "غزة إسرائيل", hours_back: i
     """
     print(f"🔍 Searching Arabic media for: '{query}' (last {hours_back} hours)")
     
-    arabic_sources = {
-        "Al Jazeera Arabic": "https://www.aljazeera.net/rss/all.xml",
-        "BBC Arabic": "https://feeds.bbci.co.uk/arabic/rss.xml", 
-        "RT Arabic": "https://arabic.rt.com/rss/",
-        "Sky News Arabic": "https://www.skynewsarabia.com/rss.xml",
-        "Al Arabiya": "https://www.alarabiya.net/ar/rss.xml"
-    }
-    
-    all_articles = []
-    cutoff_time = datetime.now() - timedelta(hours=hours_back)
+    all_articles = search_news(get_sources('arabic'), query, hours_back, SIDE_KEYWORDS['arabic'])
     
-    for source_name, rss_url in arabic_sources.items():
-        try:
-            print(f"  📰 Fetching {source_name}...")
-            feed = feedparser.parse(rss_url)
-            
-            for entry in feed.entries[:15]:
-                title_text = entry.get('title', '').lower()
-                summary_text = entry.get('summary', '').lower()
-                
-                keywords = ['غزة', 'إسرائيل', 'فلسطين', 'gaza', 'israel', 'palestine']
-                
-                if any(keyword in title_text or keyword in summary_text 
-                      for keyword in keywords):
-                    
-                    pub_date = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        pub_date = datetime(*entry.published_parsed[:6])
-                    
-                    if pub_date and pub_date >= cutoff_time:
-                        all_articles.append({
-                            'title': entry.get('title', 'No title'),
-                            'url': entry.get('link', ''),
-                            'source': source_name,
-                            'summary': entry.get('summary', 'No summary')[:500],
-                            'published': pub_date.isoformat(),
-                            'category': 'arabic_media'
-                        })
-                        
-            print(f"    ✅ Found articles from {source_name}")
-            
-        except Exception as e:
-            print(f"    ❌ Error with {source_name}: {e}")
-            continue
-    
-    all_articles.sort(key=lambda x: x['published'], reverse=True)
     print(f"✅ Found {len(all_articles)} Arabic media articles")
-    return all_articles[:10]
+    return all_articles
 
 
 @tool
@@ -247,6 +178,10 @@ def find_matching_articles(western_articles_json: str, arabic_articles_json: str
     except:
         return json.dumps({"error": "Invalid input format for articles"})
     
+    # One representative per syndicated story, so duplicates don't use up prompt space
+    western_articles = deduplicate_articles(western_articles)
+    arabic_articles = deduplicate_articles(arabic_articles)
+    
     # Use AI to analyze and match articles
     matching_prompt = f"""
 You are an expert news analyst specializing in the Israeli war on Gaza. I need you to intelligently match Western and Arabic news articles that cover the same events or closely related incidents in this conflict.
@@ -306,7 +241,7 @@ Be thorough but only match articles that genuinely appear to cover the same or v
 
     try:
         print("🤖 Sending articles to AI for intelligent matching...")
-        model = DirectGeminiModel("gemini-1.5-flash")
+        model = gemini_models.get("gemini-1.5-flash")
         ai_response = model.complete(matching_prompt)
         
         print("✅ AI matching analysis completed")
@@ -459,103 +394,21 @@ def fetch_full_article_content(url: str) -> str:
     Returns:
         JSON string containing the full article text or error message
     """
-    print(f"📖 Fetching full content from: {url[:50]}...")
-    
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Parse HTML content
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Try to find article content (common selectors)
-        content_selectors = [
-            'article', '.article-body', '.story-body', '.entry-content',
-            '.post-content', '.content', '.article-content', '#article-body',
-            '.article-text', '.story-content', '.post-text'
-        ]
-        
-        article_text = ""
-        for selector in content_selectors:
-            content_div = soup.select_one(selector)
-            if content_div:
-                article_text = content_div.get_text(strip=True)
-                break
-        
-        if not article_text:
-            # Fallback: get all paragraph text
-            paragraphs = soup.find_all('p')
-            article_text = '\n'.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-        
-        # Limit content length for AI processing
-        article_text = article_text[:4000]  # Keep first 4000 characters
-        
-        print(f"✅ Fetched {len(article_text)} characters")
-        
-        return json.dumps({
-            'url': url,
-            'content': article_text,
-            'length': len(article_text),
-            'success': True
-        })
-        
-    except Exception as e:
-        print(f"❌ Error fetching {url}: {e}")
-        return json.dumps({
-            'url': url,
-            'content': '',
-            'error': str(e),
-            'success': False
-        })
+    result = fetch_article_content(url)
+    if result.get('success'):
+        # Hand the agent the most fact-dense paragraphs rather than the whole page
+        content = condense_text(result['content'], token_budget=TOOL_CONTENT_TOKEN_BUDGET)
+        result = {**result, 'content': content, 'length': len(content)}
+    return json.dumps(result)
 
 
-@tool
-def ai_analyze_article_contradictions(western_article_json: str, arabic_article_json: str, western_content_json: str, arabic_content_json: str) -> str:
-    """
-    Use AI to deeply analyze contradictions and differences between matched Western and Arabic articles
-    
-    Args:
-        western_article_json: JSON string of Western article metadata
-        arabic_article_json: JSON string of Arabic article metadata  
-        western_content_json: JSON string of Western article full content
-        arabic_content_json: JSON string of Arabic article full content
-        
-    Returns:
-        JSON string containing detailed AI analysis with specific contradictions highlighted
-    """
-    print("🔍 Starting deep AI contradiction analysis...")
-    
-    try:
-        western_article = json.loads(western_article_json)
-        arabic_article = json.loads(arabic_article_json)
-        western_content = json.loads(western_content_json)
-        arabic_content = json.loads(arabic_content_json)
-    except:
-        return json.dumps({"error": "Invalid input format for AI analysis"})
-    
-    # Enhanced analysis prompt focusing on specific contradictions
-    analysis_prompt = f"""
-You are an expert fact-checker and media analyst specializing in the Gaza conflict. Analyze these two articles covering the same event and identify SPECIFIC CONTRADICTIONS with exact quotes and evidence.
+# Bump whenever the contradiction prompt or content condensing changes, so stored pair analyses are redone
+CONTRADICTION_PROMPT_VERSION = "1"
 
-**WESTERN ARTICLE ({western_article['source']}):**
-Title: {western_article['title']}
-URL: {western_article['url']}
-Content: {western_content.get('content', 'Content not available')[:2500]}
-
-**ARABIC ARTICLE ({arabic_article['source']}):**
-Title: {arabic_article['title']}
-URL: {arabic_article['url']}
-Content: {arabic_content.get('content', 'Content not available')[:2500]}
+# Contradiction prompt building blocks, shared by single-pair and batched requests
+CONTRADICTION_PROMPT_INTRO = "You are an expert fact-checker and media analyst specializing in the Gaza conflict. Analyze these two articles covering the same event and identify SPECIFIC CONTRADICTIONS with exact quotes and evidence."
 
-FIND AND DOCUMENT SPECIFIC CONTRADICTIONS:
+CONTRADICTION_INSTRUCTIONS = """FIND AND DOCUMENT SPECIFIC CONTRADICTIONS:
 
 1. **FACTUAL CONTRADICTIONS** - Find exact discrepancies:
    - Different casualty numbers for the same incident
@@ -585,87 +438,302 @@ For each contradiction found, provide:
 - EXACT QUOTES from both articles
 - Clear explanation of the discrepancy
 - Assessment of which version is more credible and why
-- Potential reasons for the contradiction (bias, different sources, propaganda)
+- Potential reasons for the contradiction (bias, different sources, propaganda)"""
 
-Respond in JSON format:
-{{
-    "contradiction_summary": {{
+PAIR_ANALYSIS_SCHEMA = """{
+    "contradiction_summary": {
         "total_contradictions_found": 3,
         "severity_level": "high/medium/low",
         "main_discrepancy": "brief description of biggest contradiction"
-    }},
+    },
     "specific_contradictions": [
-        {{
+        {
             "contradiction_id": 1,
             "type": "factual/attribution/sequence/context/source",
             "category": "casualty_numbers/location/timing/responsibility/other",
             "severity": "critical/high/medium/low",
-            "western_claim": {{
+            "western_claim": {
                 "exact_quote": "exact text from western article",
                 "context": "surrounding context of the quote",
                 "source_attribution": "who/what is cited as source"
-            }},
-            "arabic_claim": {{
+            },
+            "arabic_claim": {
                 "exact_quote": "exact text from arabic article (in original language if needed)",
                 "english_translation": "english translation if arabic quote",
                 "context": "surrounding context of the quote",
                 "source_attribution": "who/what is cited as source"
-            }},
+            },
             "discrepancy_explanation": "clear explanation of how these contradict each other",
-            "credibility_assessment": {{
+            "credibility_assessment": {
                 "more_credible": "western/arabic/unclear",
                 "reasoning": "why one seems more credible",
                 "verification_status": "verifiable/unverifiable/conflicting_sources"
-            }},
+            },
             "potential_causes": ["bias", "different_sources", "propaganda", "translation_error", "timing_difference"],
             "impact_on_understanding": "how this contradiction affects overall truth"
-        }}
+        }
     ],
-    "bias_patterns": {{
+    "bias_patterns": {
         "western_bias_indicators": [
-            {{
+            {
                 "bias_type": "language/sourcing/omission/emphasis",
                 "example": "specific example from text",
                 "explanation": "how this shows bias"
-            }}
+            }
         ],
         "arabic_bias_indicators": [
-            {{
+            {
                 "bias_type": "language/sourcing/omission/emphasis", 
                 "example": "specific example from text",
                 "explanation": "how this shows bias"
-            }}
+            }
         ]
-    }},
-    "information_gaps": {{
+    },
+    "information_gaps": {
         "western_omissions": [
-            {{
+            {
                 "missing_info": "what important info is missing",
                 "present_in_arabic": "corresponding info from arabic article",
                 "significance": "why this omission matters"
-            }}
+            }
         ],
         "arabic_omissions": [
-            {{
+            {
                 "missing_info": "what important info is missing", 
                 "present_in_western": "corresponding info from western article",
                 "significance": "why this omission matters"
-            }}
+            }
         ]
-    }},
-    "overall_assessment": {{
+    },
+    "overall_assessment": {
         "reliability_ranking": "which_article_more_reliable",
         "truth_likelihood": "assessment of what probably actually happened",
         "reader_recommendation": "how readers should approach these conflicting accounts",
         "verification_needed": ["specific claims that need independent verification"]
-    }}
-}}
+    }
+}"""
+
+CONTRADICTION_PROMPT_CLOSING = "Be extremely thorough and specific. Use exact quotes and clear explanations for every contradiction identified."
+
+
+def format_pair_articles(western_article: dict, arabic_article: dict, western_text: str, arabic_text: str) -> str:
+    """The two articles of a pair as they appear in contradiction prompts"""
+    return f"""**WESTERN ARTICLE ({western_article['source']}):**
+Title: {western_article['title']}
+URL: {western_article['url']}
+Content: {western_text}
+
+**ARABIC ARTICLE ({arabic_article['source']}):**
+Title: {arabic_article['title']}
+URL: {arabic_article['url']}
+Content: {arabic_text}"""
+
+
+BATCH_PROMPT_INTRO = "You are an expert fact-checker and media analyst specializing in the Gaza conflict. Below are {count} independent pairs of articles; the two articles in each pair cover the same event. For EACH pair separately, identify SPECIFIC CONTRADICTIONS with exact quotes and evidence."
+
+BATCH_RESPONSE_FORMAT = """Respond in JSON format with exactly one entry per pair, in pair order:
+{"pairs": [{"pair_id": 1, "analysis": {...}}, {"pair_id": 2, "analysis": {...}}]}
+where each "analysis" object has this format:"""
+
+# Pairs per batched contradiction prompt (1 disables batching), and the prompt size a batch may grow to
+CONTRADICTION_BATCH_SIZE = 3
+BATCH_PROMPT_TOKEN_BUDGET = 6000
+
+
+class BatchSizer:
+    """Adaptive pairs-per-batch: halved whenever a batched reply can't be split back into pairs, regrown on success"""
+    
+    def __init__(self, maximum: int = CONTRADICTION_BATCH_SIZE):
+        self.maximum = maximum
+        self.current = maximum
+        self.lock = threading.Lock()
+    
+    def size(self) -> int:
+        with self.lock:
+            return self.current
+    
+    def record(self, parsed: bool):
+        with self.lock:
+            self.current = min(self.current + 1, self.maximum) if parsed else max(self.current // 2, 1)
+
+
+batch_sizer = BatchSizer()
+
+
+# Matched pairs analyzed per request by default (callers may ask for up to MAX_PAIR_ANALYSIS_BUDGET),
+# and how many pair analyses run against Gemini at once across all requests
+PAIR_ANALYSIS_BUDGET = 10
+MAX_PAIR_ANALYSIS_BUDGET = 25
+MAX_CONCURRENT_PAIR_ANALYSES = 10
 
-Be extremely thorough and specific. Use exact quotes and clear explanations for every contradiction identified."""
+_pair_analysis_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAIR_ANALYSES, thread_name_prefix="pair-analysis")
+
+
+@tool
+def ai_analyze_article_contradictions(western_article_json: str, arabic_article_json: str, western_content_json: str, arabic_content_json: str) -> str:
+    """
+    Use AI to deeply analyze contradictions and differences between matched Western and Arabic articles
+    
+    Args:
+        western_article_json: JSON string of Western article metadata
+        arabic_article_json: JSON string of Arabic article metadata  
+        western_content_json: JSON string of Western article full content
+        arabic_content_json: JSON string of Arabic article full content
+        
+    Returns:
+        JSON string containing detailed AI analysis with specific contradictions highlighted
+    """
+    try:
+        western_article = json.loads(western_article_json)
+        arabic_article = json.loads(arabic_article_json)
+        western_content = json.loads(western_content_json)
+        arabic_content = json.loads(arabic_content_json)
+    except:
+        return json.dumps({"error": "Invalid input format for AI analysis"})
+    
+    return json.dumps(analyze_pair_contradictions(western_article, arabic_article, western_content, arabic_content))
+
+
+def pair_cache_key(western_article: dict, arabic_article: dict, western_content: dict, arabic_content: dict):
+    """Contradiction cache key for a pair, or None if either article body is missing (such analyses aren't stored)"""
+    if not (western_content.get('success') and arabic_content.get('success')):
+        return None
+    return pair_key(
+        western_article['url'], arabic_article['url'],
+        content_hash(western_article['title'], western_content['content']),
+        content_hash(arabic_article['title'], arabic_content['content']),
+        CONTRADICTION_PROMPT_VERSION
+    )
+
+
+def store_pair_analysis(key, analysis: dict):
+    """Store a structured analysis; errors and unparsed replies are not stored, so they are retried next time"""
+    if key and 'error' not in analysis and 'raw_analysis' not in analysis:
+        contradiction_cache.put(key, analysis)
+
+
+def analyze_pair_contradictions(western_article: dict, arabic_article: dict, western_content: dict, arabic_content: dict,
+                                shared_elements: list = None) -> dict:
+    """
+    Contradictions between one matched pair, reusing the stored analysis if neither article's text has changed
+    
+    Args:
+        western_article: Western article metadata (title, url, source)
+        arabic_article: Arabic article metadata (title, url, source)
+        western_content: fetch_article_content result for the Western article
+        arabic_content: fetch_article_content result for the Arabic article
+        shared_elements: What the matcher found both articles cover (only used when Gemini is asked)
+        
+    Returns:
+        Analysis dictionary (a fresh copy the caller may modify), or a dictionary with an 'error' key
+    """
+    key = pair_cache_key(western_article, arabic_article, western_content, arabic_content)
+    cached = contradiction_cache.get(key) if key else None
+    if cached is not None:
+        print(f"♻️ Reusing stored contradiction analysis for {western_article['source']} / {arabic_article['source']}")
+        return copy.deepcopy(cached)
+    
+    analysis = request_pair_analysis(western_article, arabic_article, western_content, arabic_content, shared_elements)
+    store_pair_analysis(key, analysis)
+    return copy.deepcopy(analysis)
+
+
+def condense_pair_texts(western_article: dict, arabic_article: dict, western_content: dict, arabic_content: dict,
+                        shared_elements: list = None) -> tuple:
+    """Both article bodies condensed for a contradiction prompt, favouring paragraphs about what the pair shares"""
+    # Keep the paragraphs with the shared facts, figures and names rather than the first N characters
+    focus_terms = list(shared_elements or []) + [western_article['title'], arabic_article['title']]
+    western_text = condense_text(western_content.get('content') or 'Content not available', focus_terms)
+    arabic_text = condense_text(arabic_content.get('content') or 'Content not available', focus_terms)
+    return western_text, arabic_text
+
+
+def extract_json_text(ai_response: str) -> str:
+    """Strip a ```json fence or surrounding prose from a model reply"""
+    if "```json" in ai_response:
+        json_start = ai_response.find("```json") + 7
+        json_end = ai_response.find("```", json_start)
+        return ai_response[json_start:json_end].strip()
+    if "{" in ai_response:
+        json_start = ai_response.find("{")
+        json_end = ai_response.rfind("}") + 1
+        return ai_response[json_start:json_end]
+    return ai_response
+
+
+def describe_pair_articles(western_article: dict, arabic_article: dict) -> dict:
+    """The 'articles_analyzed' metadata of a pair analysis (read by format_contradiction_for_ui and the Twitter agent)"""
+    return {
+        'western': {
+            'title': western_article['title'],
+            'source': western_article['source'],
+            'url': western_article['url']
+        },
+        'arabic': {
+            'title': arabic_article['title'],
+            'source': arabic_article['source'],
+            'url': arabic_article['url']
+        }
+    }
+
+
+def finalize_pair_analysis(analysis_result: dict, western_article: dict, arabic_article: dict) -> dict:
+    """Add the metadata the UI needs to a parsed pair analysis and log what it found"""
+    analysis_result['ai_analysis'] = True
+    analysis_result['analysis_timestamp'] = datetime.now().isoformat()
+    analysis_result['articles_analyzed'] = describe_pair_articles(western_article, arabic_article)
+    
+    # Log contradiction findings for debugging
+    if 'specific_contradictions' in analysis_result:
+        print(f"🔍 Found {len(analysis_result['specific_contradictions'])} specific contradictions:")
+        for i, contradiction in enumerate(analysis_result['specific_contradictions'][:3]):  # Show first 3
+            print(f"   {i+1}. {contradiction.get('type', 'unknown')} - {contradiction.get('discrepancy_explanation', 'N/A')[:100]}...")
+    
+    return analysis_result
+
+
+def gemini_error_analysis(error: GeminiError) -> dict:
+    """Analysis placeholder for a pair whose Gemini request failed, with the structured error for the UI"""
+    return {
+        'error': f'AI analysis failed: {str(error)}',
+        **error.to_dict(),
+        'fallback_available': True
+    }
+
+
+def request_pair_analysis(western_article: dict, arabic_article: dict, western_content: dict, arabic_content: dict,
+                          shared_elements: list = None) -> dict:
+    """
+    Ask Gemini for the specific contradictions between one matched pair
+    
+    Args:
+        western_article: Western article metadata (title, url, source)
+        arabic_article: Arabic article metadata (title, url, source)
+        western_content: fetch_article_content result for the Western article
+        arabic_content: fetch_article_content result for the Arabic article
+        shared_elements: What the matcher found both articles cover; steers which paragraphs make it into the prompt
+        
+    Returns:
+        Analysis dictionary (specific_contradictions etc.), or a dictionary with an 'error' key
+    """
+    print("🔍 Starting deep AI contradiction analysis...")
+    
+    western_text, arabic_text = condense_pair_texts(
+        western_article, arabic_article, western_content, arabic_content, shared_elements
+    )
+    
+    # Enhanced analysis prompt focusing on specific contradictions
+    analysis_prompt = (
+        f"\n{CONTRADICTION_PROMPT_INTRO}\n\n"
+        f"{format_pair_articles(western_article, arabic_article, western_text, arabic_text)}\n\n"
+        f"{CONTRADICTION_INSTRUCTIONS}\n\n"
+        f"Respond in JSON format:\n{PAIR_ANALYSIS_SCHEMA}\n\n"
+        f"{CONTRADICTION_PROMPT_CLOSING}"
+    )
     
     # Use the DirectGeminiModel to analyze
     try:
-        model = DirectGeminiModel("gemini-1.5-flash")
+        model = gemini_models.get("gemini-1.5-flash")
         
         print("🤖 Sending articles to AI for deep contradiction analysis...")
         ai_response = model.complete(analysis_prompt)
@@ -674,62 +742,80 @@ Be extremely thorough and specific. Use exact quotes and clear explanations for
         
         # Try to parse the AI response as JSON
         try:
-            # Extract JSON from AI response if it's wrapped in text
-            if "```json" in ai_response:
-                json_start = ai_response.find("```json") + 7
-                json_end = ai_response.find("```", json_start)
-                ai_response = ai_response[json_start:json_end].strip()
-            elif "{" in ai_response:
-                json_start = ai_response.find("{")
-                json_end = ai_response.rfind("}") + 1
-                ai_response = ai_response[json_start:json_end]
-            
-            # Parse and validate the JSON
-            analysis_result = json.loads(ai_response)
-            
-            # Add metadata and enhance for UI display
-            analysis_result['ai_analysis'] = True
-            analysis_result['analysis_timestamp'] = datetime.now().isoformat()
-            analysis_result['articles_analyzed'] = {
-                'western': {
-                    'title': western_article['title'],
-                    'source': western_article['source'],
-                    'url': western_article['url']
-                },
-                'arabic': {
-                    'title': arabic_article['title'],
-                    'source': arabic_article['source'],
-                    'url': arabic_article['url']
-                }
-            }
-            
-            # Log contradiction findings for debugging
-            if 'specific_contradictions' in analysis_result:
-                print(f"🔍 Found {len(analysis_result['specific_contradictions'])} specific contradictions:")
-                for i, contradiction in enumerate(analysis_result['specific_contradictions'][:3]):  # Show first 3
-                    print(f"   {i+1}. {contradiction.get('type', 'unknown')} - {contradiction.get('discrepancy_explanation', 'N/A')[:100]}...")
-            
-            return json.dumps(analysis_result)
+            ai_response = extract_json_text(ai_response)
+            return finalize_pair_analysis(json.loads(ai_response), western_article, arabic_article)
             
         except json.JSONDecodeError:
             # If JSON parsing fails, return the raw AI analysis
             print("⚠️ AI response not in JSON format, returning raw analysis")
-            return json.dumps({
+            return {
                 'ai_analysis': True,
                 'raw_analysis': ai_response,
-                'articles_analyzed': {
-                    'western': western_article['title'],
-                    'arabic': arabic_article['title']
-                },
+                'articles_analyzed': describe_pair_articles(western_article, arabic_article),
                 'note': 'AI provided analysis in text format rather than structured JSON'
-            })
+            }
             
+    except GeminiError as e:
+        print(f"❌ AI analysis error: {e}")
+        return gemini_error_analysis(e)
     except Exception as e:
         print(f"❌ AI analysis error: {e}")
-        return json.dumps({
+        return {
             'error': f'AI analysis failed: {str(e)}',
             'fallback_available': True
-        })
+        }
+
+
+def request_batch_analysis(batch: list) -> dict:
+    """
+    Ask Gemini about several matched pairs in one request, so the instruction block is sent once
+    
+    Args:
+        batch: Pending pair dictionaries (western_article, arabic_article, western_text, arabic_text)
+        
+    Returns:
+        Dictionary mapping the batch position (1-based) of every pair whose analysis came back parseable to that
+        analysis; empty if the reply couldn't be split (not JSON, truncated, wrong shape)
+        
+    Raises:
+        GeminiError: If the request itself failed
+    """
+    sections = '\n\n'.join(
+        f"=== PAIR {position} ===\n"
+        f"{format_pair_articles(pair['western_article'], pair['arabic_article'], pair['western_text'], pair['arabic_text'])}"
+        for position, pair in enumerate(batch, 1)
+    )
+    batch_prompt = (
+        f"\n{BATCH_PROMPT_INTRO.format(count=len(batch))}\n\n"
+        f"{sections}\n\n"
+        f"{CONTRADICTION_INSTRUCTIONS}\n\n"
+        f"{BATCH_RESPONSE_FORMAT}\n{PAIR_ANALYSIS_SCHEMA}\n\n"
+        f"{CONTRADICTION_PROMPT_CLOSING}"
+    )
+    
+    print(f"🤖 Sending {len(batch)} article pairs to AI in one batched contradiction analysis...")
+    ai_response = gemini_models.get("gemini-1.5-flash").complete(
+        batch_prompt, output_tokens=GEMINI_OUTPUT_TOKEN_ALLOWANCE * len(batch)
+    )
+    
+    try:
+        reply = json.loads(extract_json_text(ai_response))
+    except json.JSONDecodeError:
+        print("⚠️ Batched AI response not in JSON format")
+        return {}
+    
+    entries = reply.get('pairs', []) if isinstance(reply, dict) else reply
+    analyses = {}
+    for entry in entries if isinstance(entries, list) else []:
+        if not isinstance(entry, dict) or not isinstance(entry.get('analysis'), dict):
+            continue
+        try:
+            position = int(entry.get('pair_id'))
+        except (TypeError, ValueError):
+            continue
+        if 1 <= position <= len(batch):
+            analyses[position] = entry['analysis']
+    return analyses
 
 
 @tool
@@ -750,43 +836,178 @@ def comprehensive_contradiction_analysis(matches_json: str) -> str:
     except:
         return json.dumps({"error": "Invalid input format for matches"})
     
-    all_contradictions = []
+    all_contradictions = sorted(iter_contradiction_analyses(matches), key=lambda analysis: analysis['match_id'])
     
-    # Analyze each matched pair with AI for contradictions
-    for i, match in enumerate(matches[:3]):  # Limit to 3 pairs for performance
+    return json.dumps(build_contradiction_report(all_contradictions))
+
+
+def pack_pair_batches(pending: list, max_size: int) -> list:
+    """
+    Greedily split pending pairs into batches of at most max_size pairs whose prompt fits BATCH_PROMPT_TOKEN_BUDGET
+    and whose expected reply (GEMINI_OUTPUT_TOKEN_ALLOWANCE per pair) fits GEMINI_MAX_OUTPUT_TOKENS
+    """
+    max_size = max(min(max_size, GEMINI_MAX_OUTPUT_TOKENS // GEMINI_OUTPUT_TOKEN_ALLOWANCE), 1)
+    overhead = estimate_tokens(BATCH_PROMPT_INTRO + CONTRADICTION_INSTRUCTIONS + BATCH_RESPONSE_FORMAT +
+                               PAIR_ANALYSIS_SCHEMA + CONTRADICTION_PROMPT_CLOSING)
+    batches, current, used = [], [], overhead
+    for pair in pending:
+        cost = estimate_tokens(format_pair_articles(
+            pair['western_article'], pair['arabic_article'], pair['western_text'], pair['arabic_text']
+        ))
+        if current and (len(current) >= max_size or used + cost > BATCH_PROMPT_TOKEN_BUDGET):
+            batches.append(current)
+            current, used = [], overhead
+        current.append(pair)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def analyze_pending_batch(batch: list) -> dict:
+    """
+    Analyze a batch of uncached pairs, retrying any pair the batched reply didn't cover as a single-pair request
+    
+    If the batched request itself fails, every pair gets the error instead.
+    
+    Returns:
+        Dictionary mapping match_id to that pair's analysis
+    """
+    analyses = {}
+    if len(batch) > 1:
+        try:
+            batched = request_batch_analysis(batch)
+        except GeminiError as e:
+            # The request already went through its retries: firing one request per pair now would only multiply
+            # traffic against an exhausted quota, and a failed request says nothing about the batch size
+            print(f"❌ Batched AI analysis error: {e}")
+            return {pair['match_id']: gemini_error_analysis(e) for pair in batch}
+        batch_sizer.record(len(batched) == len(batch))
+        for position, analysis in batched.items():
+            pair = batch[position - 1]
+            analyses[pair['match_id']] = finalize_pair_analysis(analysis, pair['western_article'], pair['arabic_article'])
+            store_pair_analysis(pair['key'], analyses[pair['match_id']])
+    
+    for pair in batch:
+        if pair['match_id'] in analyses:
+            continue
+        if len(batch) > 1:
+            print(f"↩️ Pair {pair['match_id']} missing from batched reply, analyzing it on its own")
+        analyses[pair['match_id']] = request_pair_analysis(
+            pair['western_article'], pair['arabic_article'],
+            pair['western_content'], pair['arabic_content'], pair['shared_elements']
+        )
+        store_pair_analysis(pair['key'], analyses[pair['match_id']])
+    
+    return {match_id: copy.deepcopy(analysis) for match_id, analysis in analyses.items()}
+
+
+def analyze_match_group(group: list, total: int, content_futures: dict) -> list:
+    """
+    Analyze a group of matched pairs once their prefetched article bodies have arrived
+    
+    Stored analyses are reused; the remaining pairs are packed into batched prompts under BATCH_PROMPT_TOKEN_BUDGET.
+    
+    Args:
+        group: (match_id, match) tuples
+        total: Number of pairs in the whole run (for logging)
+        content_futures: Prefetched fetch_article_content futures by URL
+        
+    Returns:
+        Analysis dictionaries (each carries its 'match_id' and 'match_score')
+    """
+    analyses = {}
+    pending = []
+    for match_id, match in group:
         western_article = match['western_article']
         arabic_article = match['arabic_article']
         
-        print(f"\n🔍 Contradiction Analysis {i+1}/{min(len(matches), 3)}:")
+        # Wait for this pair's prefetched content (other groups keep downloading and analyzing meanwhile)
+        western_content = content_futures[western_article['url']].result()
+        arabic_content = content_futures[arabic_article['url']].result()
+        
+        print(f"\n🔍 Contradiction Analysis {match_id}/{total}:")
         print(f"  🇺🇸 Western: {western_article['source']} - {western_article['title'][:60]}...")
         print(f"  🇵🇸 Arabic: {arabic_article['source']} - {arabic_article['title'][:60]}...")
         
-        # Fetch full content for both articles
-        print("📖 Fetching full article content for deep contradiction analysis...")
-        western_content = fetch_full_article_content(western_article['url'])
-        arabic_content = fetch_full_article_content(arabic_article['url'])
+        key = pair_cache_key(western_article, arabic_article, western_content, arabic_content)
+        cached = contradiction_cache.get(key) if key else None
+        if cached is not None:
+            print(f"♻️ Reusing stored contradiction analysis for pair {match_id}")
+            analyses[match_id] = copy.deepcopy(cached)
+            continue
         
-        # Perform detailed AI contradiction analysis
-        contradiction_analysis_result = ai_analyze_article_contradictions(
-            json.dumps(western_article),
-            json.dumps(arabic_article), 
-            western_content,
-            arabic_content
+        shared_elements = match.get('shared_elements', [])
+        western_text, arabic_text = condense_pair_texts(
+            western_article, arabic_article, western_content, arabic_content, shared_elements
         )
-        
-        contradiction_data = json.loads(contradiction_analysis_result)
-        contradiction_data['match_id'] = i + 1
+        pending.append({
+            'match_id': match_id,
+            'key': key,
+            'western_article': western_article,
+            'arabic_article': arabic_article,
+            'western_content': western_content,
+            'arabic_content': arabic_content,
+            'western_text': western_text,
+            'arabic_text': arabic_text,
+            'shared_elements': shared_elements
+        })
+    
+    for batch in pack_pair_batches(pending, batch_sizer.size()):
+        analyses.update(analyze_pending_batch(batch))
+    
+    results = []
+    for match_id, match in group:
+        contradiction_data = analyses[match_id]
+        contradiction_data['match_id'] = match_id
         contradiction_data['match_score'] = match.get('match_score', 0)
         
-        all_contradictions.append(contradiction_data)
-        
         # Log findings
         if 'specific_contradictions' in contradiction_data:
             contradictions_found = len(contradiction_data.get('specific_contradictions', []))
-            print(f"🚨 Found {contradictions_found} specific contradictions in this pair")
+            print(f"🚨 Found {contradictions_found} specific contradictions in pair {match_id}")
         
-        print(f"✅ Contradiction analysis {i+1} completed")
+        print(f"✅ Contradiction analysis {match_id} completed")
+        results.append(contradiction_data)
+    return results
+
+
+def iter_contradiction_analyses(matches: list, max_pairs: int = PAIR_ANALYSIS_BUDGET):
+    """
+    Analyze up to max_pairs matched pairs concurrently, yielding each pair's analysis as soon as it is ready
+    
+    Pairs are grouped (batch_sizer.size() per group) so a group's uncached pairs can share one Gemini request.
     
+    Args:
+        matches: Matched pairs from find_matching_articles, best first
+        max_pairs: How many of the top pairs to analyze
+        
+    Yields:
+        Analysis dictionaries in completion order (each carries its 'match_id')
+    """
+    pairs = list(enumerate(matches[:max_pairs], 1))
+    
+    # Download every matched article body at once instead of two at a time per pair
+    content_futures = prefetch_article_contents(
+        url
+        for _, match in pairs
+        for url in (match['western_article']['url'], match['arabic_article']['url'])
+    )
+    
+    group_size = batch_sizer.size()
+    groups = [pairs[i:i + group_size] for i in range(0, len(pairs), group_size)]
+    print(f"🔍 Analyzing {len(pairs)} matched pairs in {len(groups)} groups of up to {group_size}, "
+          f"up to {MAX_CONCURRENT_PAIR_ANALYSES} groups at a time...")
+    futures = [
+        _pair_analysis_executor.submit(analyze_match_group, group, len(pairs), content_futures)
+        for group in groups
+    ]
+    for future in as_completed(futures):
+        yield from future.result()
+
+
+def build_contradiction_report(all_contradictions: list) -> dict:
+    """Aggregate per-pair contradiction analyses into the visualization-ready report"""
     # Calculate aggregate statistics
     total_contradictions = sum(len(analysis.get('specific_contradictions', [])) for analysis in all_contradictions)
     contradiction_types = {}
@@ -823,7 +1044,11 @@ def comprehensive_contradiction_analysis(matches_json: str) -> str:
     print(f"   - Contradiction types: {list(contradiction_types.keys())}")
     print(f"   - Severity breakdown: {severity_counts}")
     
-    return json.dumps(result)
+    return result
+
+
+# generate_content arguments that change the response (and so belong in the cache key)
+GENERATION_SETTINGS = ('generation_config', 'safety_settings')
 
 
 class DirectGeminiModel:
@@ -835,64 +1060,134 @@ class DirectGeminiModel:
         print(f"✅ Initialized Direct Gemini Model: {model_name}")
     
     def generate(self, messages, **kwargs):
-        """Generate method that smolagents expects"""
-        try:
-            # Extract the prompt from messages
-            if isinstance(messages, list) and len(messages) > 0:
-                # Get the last user message
-                user_message = messages[-1]
-                if isinstance(user_message, dict) and 'content' in user_message:
-                    prompt = user_message['content']
-                elif hasattr(user_message, 'content'):
-                    prompt = user_message.content
-                else:
-                    prompt = str(user_message)
+        """
+        Generate method that smolagents expects
+        
+        Raises:
+            GeminiError: If the request failed for good (the agent sees the failure instead of an error string
+                it would take for the model's answer)
+        """
+        # Extract the prompt from messages
+        if isinstance(messages, list) and len(messages) > 0:
+            # Get the last user message
+            user_message = messages[-1]
+            if isinstance(user_message, dict) and 'content' in user_message:
+                prompt = user_message['content']
+            elif hasattr(user_message, 'content'):
+                prompt = user_message.content
             else:
-                prompt = str(messages)
-            
-            print(f"🤖 Gemini processing prompt: {prompt[:100]}...")
-            
-            # Generate response using Google's API
-            response = self.model.generate_content(prompt)
-            
-            print(f"✅ Gemini response generated successfully")
-            
-            # Return in the format smolagents expects
-            class MockResponse:
-                def __init__(self, content):
-                    self.content = content
-                    
-                def __str__(self):
-                    return self.content
-            
-            return MockResponse(response.text)
-            
-        except Exception as e:
-            print(f"❌ Direct Gemini error: {e}")
-            # Return error response
-            class MockResponse:
-                def __init__(self, content):
-                    self.content = content
-                    
-                def __str__(self):
-                    return self.content
-            
-            return MockResponse(f"Error generating response: {str(e)}")
+                prompt = str(user_message)
+        else:
+            prompt = str(messages)
+        
+        print(f"🤖 Gemini processing prompt: {prompt[:100]}...")
+        
+        # Generate response using Google's API
+        try:
+            text = self._generate(str(prompt), {})
+        except GeminiError as e:
+            print(f"❌ Direct Gemini error ({e.kind}, {e.attempts} attempts): {e}")
+            raise
+        
+        print(f"✅ Gemini response generated successfully")
+        
+        # Return in the format smolagents expects
+        class MockResponse:
+            def __init__(self, content):
+                self.content = content
+                
+            def __str__(self):
+                return self.content
+        
+        return MockResponse(text)
     
     def __call__(self, messages, **kwargs):
         """Handle direct calls to the model"""
         return self.generate(messages, **kwargs)
     
-    def complete(self, prompt, **kwargs):
-        """Alternative completion method"""
+    def _generate(self, prompt: str, settings: dict, output_tokens: int = GEMINI_OUTPUT_TOKEN_ALLOWANCE) -> str:
+        """generate_content within the client-side quota, retrying rate limits and transient errors with backoff"""
+        for attempt in range(1, GEMINI_MAX_ATTEMPTS + 1):
+            gemini_limiter.acquire(prompt, output_tokens)
+            try:
+                return self.model.generate_content(prompt, **settings).text
+            except Exception as e:
+                kind, retryable = classify_error(e)
+                if not retryable or attempt == GEMINI_MAX_ATTEMPTS:
+                    raise GeminiError(kind, str(e), retryable, attempt) from e
+                
+                delay = backoff_delay(attempt)
+                print(f"⏳ Gemini {kind} (attempt {attempt}/{GEMINI_MAX_ATTEMPTS}), retrying in {delay:.1f}s: {e}")
+                if kind == 'rate_limited':
+                    # Hold back every thread, not just this one - the next acquire() waits out the pause
+                    gemini_limiter.pause(delay)
+                else:
+                    time.sleep(delay)
+    
+    def complete(self, prompt, cache=True, output_tokens=GEMINI_OUTPUT_TOKEN_ALLOWANCE, **kwargs):
+        """
+        Alternative completion method, answered from the response cache when the same request was made before
+        
+        Args:
+            prompt: Prompt text
+            cache: Set to False to always call the API (e.g. connectivity probes)
+            output_tokens: Reply tokens to charge against the per-minute quota up front (more for batched prompts)
+            **kwargs: generation_config / safety_settings, passed to generate_content and part of the cache key
+        
+        Returns:
+            Response text
+        
+        Raises:
+            GeminiError: If the request failed for good (after retries for rate limits and transient errors)
+        """
+        prompt = str(prompt)
+        settings = {name: kwargs[name] for name in GENERATION_SETTINGS if name in kwargs}
+        key = response_key(self.model_name, prompt, settings)
+        
+        if cache:
+            cached = gemini_response_cache.get(key)
+            if cached is not None:
+                print(f"♻️ Gemini cache hit for prompt: {prompt[:60]}...")
+                return cached
+        
         try:
             print(f"🤖 Gemini completing prompt: {prompt[:100]}...")
-            response = self.model.generate_content(str(prompt))
+            text = self._generate(prompt, settings, output_tokens)
             print(f"✅ Gemini completion successful")
-            return response.text
-        except Exception as e:
-            print(f"❌ Direct Gemini completion error: {e}")
-            return f"Error: {str(e)}"
+        except GeminiError as e:
+            print(f"❌ Direct Gemini completion error ({e.kind}, {e.attempts} attempts): {e}")
+            raise
+        
+        # Errors are never cached, so a failed call is retried next time
+        if cache:
+            gemini_response_cache.put(key, text)
+        return text
+
+
+class GeminiModelRegistry:
+    """Process-wide, thread-safe DirectGeminiModel instances, one per model name"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.models = {}
+        self.pid = os.getpid()
+    
+    def get(self, model_name: str = "gemini-1.5-flash") -> DirectGeminiModel:
+        """Return the shared model for a name, creating it on first use (and again after a fork)"""
+        with self.lock:
+            if self.pid != os.getpid():
+                # gRPC channels can't be shared with a forked worker: drop the inherited google client and models
+                genai.configure(api_key=GOOGLE_API_KEY)
+                self.models = {}
+                self.pid = os.getpid()
+            
+            model = self.models.get(model_name)
+            if model is None:
+                model = self.models[model_name] = DirectGeminiModel(model_name)
+            return model
+
+
+gemini_models = GeminiModelRegistry()
 
 
 async def notify_twitter_agent(analysis_results: dict, twitter_agent_url: str = "http://localhost:5001"):
@@ -922,7 +1217,7 @@ def create_media_factcheck_agent():
     print("🤖 Creating agent with Direct Gemini Model...")
     
     # Create direct Gemini model (bypassing LiteLLM)
-    model = DirectGeminiModel("gemini-1.5-flash")
+    model = gemini_models.get("gemini-1.5-flash")
     
     # Create agent with enhanced AI analysis tools
     agent = CodeAgent(
@@ -942,6 +1237,124 @@ def create_media_factcheck_agent():
     return agent
 
 
+def format_contradiction_for_ui(ai_analysis: dict):
+    """Reduce a pair's AI analysis to what the dashboard renders (None if the analysis has no article metadata)"""
+    if 'articles_analyzed' not in ai_analysis:
+        return None
+    
+    return {
+        'match_id': ai_analysis.get('match_id', 1),
+        'western_article': {
+            'title': ai_analysis['articles_analyzed']['western']['title'],
+            'source': ai_analysis['articles_analyzed']['western']['source'],
+            'url': ai_analysis['articles_analyzed']['western']['url']
+        },
+        'arabic_article': {
+            'title': ai_analysis['articles_analyzed']['arabic']['title'],
+            'source': ai_analysis['articles_analyzed']['arabic']['source'],
+            'url': ai_analysis['articles_analyzed']['arabic']['url']
+        },
+        'ai_contradictions_found': ai_analysis.get('specific_contradictions', [])
+    }
+
+
+def notify_twitter_agent_in_background(ai_analysis_data: dict):
+    """Send the analysis to the Twitter agent from a daemon thread so the request isn't blocked"""
+    try:
+        import asyncio
+        
+        def run_async_notify():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(notify_twitter_agent(ai_analysis_data))
+            finally:
+                loop.close()
+        
+        # Run in background thread to avoid blocking
+        thread = threading.Thread(target=run_async_notify)
+        thread.daemon = True
+        thread.start()
+        
+    except Exception as e:
+        print(f"⚠️ Could not notify Twitter agent: {e}")
+
+
+def iter_analysis_events(western_query: str, arabic_query: str, hours_back: int = 24, max_pairs: int = PAIR_ANALYSIS_BUDGET):
+    """
+    Run the full analysis pipeline as a generator, yielding results as each stage produces them
+    
+    Yields:
+        (event name, payload) tuples: 'status', 'articles' (one per source as its feed arrives),
+        'articles_ready', 'match', 'contradiction' (one per analyzed pair) and finally 'complete'
+    """
+    print(f"📊 Starting streamed analysis for: Western='{western_query}', Arabic='{arabic_query}'")
+    
+    yield 'status', {'message': 'Collecting articles from Western and Arabic media...'}
+    
+    ranked_articles = {}
+    for side, query in (('western', western_query), ('arabic', arabic_query)):
+        side_sources = get_sources(side)
+        side_articles = []
+        for source_name, articles in iter_source_articles(side_sources, query, hours_back, SIDE_KEYWORDS[side]):
+            side_articles.extend(articles)
+            yield 'articles', {'side': side, 'source': source_name, 'articles': articles}
+        ranked_articles[side] = rank_articles(side_articles, sources=side_sources)
+    
+    western_articles = ranked_articles['western']
+    arabic_articles = ranked_articles['arabic']
+    yield 'articles_ready', {'western_articles': western_articles, 'arabic_articles': arabic_articles}
+    
+    yield 'status', {'message': f'Matching {len(western_articles)} Western and {len(arabic_articles)} Arabic articles with AI...'}
+    matches = json.loads(find_matching_articles(json.dumps(western_articles), json.dumps(arabic_articles)))
+    for match in matches:
+        yield 'match', match
+    
+    all_contradictions = []
+    contradictions_shown = 0
+    if matches:
+        yield 'status', {'message': f'Analyzing {min(len(matches), max_pairs)} matched pairs for contradictions...'}
+        for contradiction_data in iter_contradiction_analyses(matches, max_pairs):
+            all_contradictions.append(contradiction_data)
+            formatted_contradiction = format_contradiction_for_ui(contradiction_data)
+            if formatted_contradiction:
+                contradictions_shown += 1
+                yield 'contradiction', formatted_contradiction
+    
+    all_contradictions.sort(key=lambda analysis: analysis['match_id'])
+    ai_analysis_data = build_contradiction_report(all_contradictions)
+    total_contradictions = ai_analysis_data['aggregate_statistics']['total_contradictions_found']
+    if total_contradictions > 0:
+        print(f"📡 {total_contradictions} contradictions found - notifying Twitter agent...")
+        notify_twitter_agent_in_background(ai_analysis_data)
+    
+    yield 'complete', {
+        'status': 'success',
+        'summary': {
+            'western_sources_analyzed': len(western_articles),
+            'arabic_sources_analyzed': len(arabic_articles),
+            'matched_pairs_found': len(matches),
+            # Formatted contradictions only (failed analyses aren't counted), the same figure /api/analyze reports
+            'contradictions_found': contradictions_shown,
+            'total_specific_contradictions': total_contradictions,
+            'fact_checks_performed': 1 if matches else 0,
+            'analysis_timestamp': datetime.now().isoformat(),
+            'analysis_type': 'AI-powered deep contradiction analysis'
+        }
+    }
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Encode one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.before_request
+def start_background_services():
+    """Start the feed poller in the serving process (no-op once it is running)"""
+    feed_poller.ensure_started()
+
+
 @app.route('/')
 def index():
     """Serve the enhanced dashboard page"""
@@ -1388,47 +1801,90 @@ def index():
                 
                 setLoadingState(true);
                 showResults();
-                showStatus('loading', 'Starting analysis... This may take 2-3 minutes. Please be patient.');
+                showStatus('loading', 'Starting analysis... Results will appear as soon as each step finishes.');
                 
                 clearResults();
                 
-                fetch('/api/analyze', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify({
-                        western_query: westernQuery,
-                        arabic_query: arabicQuery
-                    })
-                })
-                .then(response => {
-                    if (!response.ok) {
-                        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-                    }
-                    return response.json();
-                })
-                .then(data => {
+                // Stream the pipeline so articles, matches and contradictions render as they arrive
+                const liveSummary = {
+                    western_sources_analyzed: 0,
+                    arabic_sources_analyzed: 0,
+                    matched_pairs_found: 0,
+                    total_specific_contradictions: 0
+                };
+                const liveContradictions = [];
+                let completed = false;
+                
+                const params = new URLSearchParams({
+                    western_query: westernQuery,
+                    arabic_query: arabicQuery
+                });
+                const stream = new EventSource(`/api/analyze/stream?${params.toString()}`);
+                
+                stream.addEventListener('status', event => {
+                    showStatus('loading', JSON.parse(event.data).message);
+                });
+                
+                stream.addEventListener('articles', event => {
+                    const data = JSON.parse(event.data);
+                    liveSummary[`${data.side}_sources_analyzed`] += data.articles.length;
+                    displayMetrics(liveSummary);
+                });
+                
+                stream.addEventListener('articles_ready', event => {
+                    const data = JSON.parse(event.data);
+                    liveSummary.western_sources_analyzed = data.western_articles.length;
+                    liveSummary.arabic_sources_analyzed = data.arabic_articles.length;
+                    displayMetrics(liveSummary);
+                });
+                
+                stream.addEventListener('match', event => {
+                    liveSummary.matched_pairs_found += 1;
+                    displayMetrics(liveSummary);
+                });
+                
+                stream.addEventListener('contradiction', event => {
+                    const contradiction = JSON.parse(event.data);
+                    liveContradictions.push(contradiction);
+                    liveSummary.total_specific_contradictions += (contradiction.ai_contradictions_found || []).length;
+                    displayMetrics(liveSummary);
+                    displayContradictions(liveContradictions);
+                });
+                
+                stream.addEventListener('complete', event => {
+                    completed = true;
+                    stream.close();
                     setLoadingState(false);
-                    if (data.status === 'success') {
-                        analysisData = data;
-                        showStatus('success', 'Analysis completed successfully!');
-                        displayMetrics(data.summary);
-                        displayChart(data.summary);
-                        displayContradictions(data.contradictions || []);
-                        
-                        if (data.summary.total_specific_contradictions > 0) {
-                            showStatus('success', '🐦 Twitter agent has been notified about contradictions!', true);
-                        }
-                    } else {
-                        showStatus('error', `Analysis failed: ${data.message || 'Unknown error'}`);
+                    
+                    const data = JSON.parse(event.data);
+                    data.contradictions = liveContradictions;
+                    analysisData = data;
+                    showStatus('success', 'Analysis completed successfully!');
+                    displayMetrics(data.summary);
+                    displayChart(data.summary);
+                    displayContradictions(liveContradictions);
+                    
+                    if (data.summary.total_specific_contradictions > 0) {
+                        showStatus('success', '🐦 Twitter agent has been notified about contradictions!', true);
                     }
-                })
-                .catch(error => {
+                });
+                
+                stream.addEventListener('pipeline_error', event => {
+                    completed = true;
+                    stream.close();
                     setLoadingState(false);
-                    showStatus('error', `Request failed: ${error.message}`);
-                    console.error('Analysis error:', error);
+                    showStatus('error', `Analysis failed: ${JSON.parse(event.data).message || 'Unknown error'}`);
                 });
+                
+                stream.onerror = error => {
+                    // The browser would otherwise reconnect and restart the whole analysis
+                    stream.close();
+                    if (!completed) {
+                        setLoadingState(false);
+                        showStatus('error', 'Request failed: connection to the analysis stream was lost');
+                        console.error('Analysis error:', error);
+                    }
+                };
             }
             
             function setLoadingState(loading) {
@@ -1709,21 +2165,8 @@ def analyze_coverage():
             # Format contradictions for UI
             formatted_contradictions = []
             for ai_analysis in ai_analysis_data.get('detailed_contradictions', []):
-                if 'articles_analyzed' in ai_analysis:
-                    formatted_contradiction = {
-                        'match_id': ai_analysis.get('match_id', 1),
-                        'western_article': {
-                            'title': ai_analysis['articles_analyzed']['western']['title'],
-                            'source': ai_analysis['articles_analyzed']['western']['source'],
-                            'url': ai_analysis['articles_analyzed']['western']['url']
-                        },
-                        'arabic_article': {
-                            'title': ai_analysis['articles_analyzed']['arabic']['title'],
-                            'source': ai_analysis['articles_analyzed']['arabic']['source'],
-                            'url': ai_analysis['articles_analyzed']['arabic']['url']
-                        },
-                        'ai_contradictions_found': ai_analysis.get('specific_contradictions', [])
-                    }
+                formatted_contradiction = format_contradiction_for_ui(ai_analysis)
+                if formatted_contradiction:
                     formatted_contradictions.append(formatted_contradiction)
             
             print(f"🤖 Formatted {len(formatted_contradictions)} AI analyses for UI")
@@ -1732,25 +2175,7 @@ def analyze_coverage():
             total_contradictions = ai_analysis_data.get('aggregate_statistics', {}).get('total_contradictions_found', 0)
             if total_contradictions > 0:
                 print(f"📡 {total_contradictions} contradictions found - notifying Twitter agent...")
-                try:
-                    import asyncio
-                    import threading
-                    
-                    def run_async_notify():
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            loop.run_until_complete(notify_twitter_agent(ai_analysis_data))
-                        finally:
-                            loop.close()
-                    
-                    # Run in background thread to avoid blocking
-                    thread = threading.Thread(target=run_async_notify)
-                    thread.daemon = True
-                    thread.start()
-                    
-                except Exception as e:
-                    print(f"⚠️ Could not notify Twitter agent: {e}")
+                notify_twitter_agent_in_background(ai_analysis_data)
             
             # Format response for UI
             response = {
@@ -1822,6 +2247,28 @@ def analyze_coverage():
         }), 500
 
 
+@app.route('/api/analyze/stream', methods=['GET'])
+def analyze_coverage_stream():
+    """Server-Sent Events endpoint that streams articles, matches and contradictions as they are produced"""
+    western_query = request.args.get('western_query', 'Gaza Israel')
+    arabic_query = request.args.get('arabic_query', 'غزة إسرائيل')
+    max_pairs = min(max(request.args.get('max_pairs', PAIR_ANALYSIS_BUDGET, type=int), 1), MAX_PAIR_ANALYSIS_BUDGET)
+    
+    def generate():
+        try:
+            for event, data in iter_analysis_events(western_query, arabic_query, max_pairs=max_pairs):
+                yield format_sse(event, data)
+        except Exception as e:
+            print(f"❌ Error in streamed analysis: {str(e)}")
+            yield format_sse('pipeline_error', {'status': 'error', 'message': str(e)})
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 @app.route('/a2a/receive', methods=['POST'])
 def receive_a2a_message():
     """Endpoint to receive A2A messages from other agents"""
@@ -1914,6 +2361,18 @@ def trigger_a2a_analysis():
         }), 500
 
 
+@app.route('/api/cache/invalidate', methods=['POST'])
+def invalidate_content_cache():
+    """Drop cached article content for a URL, e.g. after the outlet updated the story"""
+    data = request.json or {}
+    url = data.get('url')
+    if not url:
+        return jsonify({'status': 'error', 'message': 'url is required'}), 400
+    
+    was_cached = content_cache.invalidate(url)
+    return jsonify({'status': 'success', 'url': url, 'was_cached': was_cached})
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -2012,6 +2471,12 @@ def api_docs():
                 <strong>Response:</strong> Analysis results with contradictions, matched pairs, and AI insights
             </div>
             
+            <div class="endpoint">
+                <h3><span class="method">GET</span> <span class="url">/api/analyze/stream?western_query=...&amp;arabic_query=...&amp;max_pairs=10</span></h3>
+                <p>Same analysis streamed as Server-Sent Events, so results appear while the pipeline runs; <code>max_pairs</code> (1-25) sets how many matched pairs are analyzed</p>
+                <strong>Events:</strong> <code>status</code>, <code>articles</code> (per source), <code>articles_ready</code>, <code>match</code>, <code>contradiction</code> (per pair), <code>complete</code>, <code>pipeline_error</code>
+            </div>
+            
             <div class="endpoint">
                 <h3><span class="method">GET</span> <span class="url">/api/health</span></h3>
                 <p>System health check endpoint</p>
@@ -2064,16 +2529,15 @@ def system_status():
     """Detailed system status endpoint"""
     try:
         # Test Google AI connection
-        model = DirectGeminiModel("gemini-1.5-flash")
-        test_response = model.complete("Test")
+        model = gemini_models.get("gemini-1.5-flash")
+        test_response = model.complete("Test", cache=False)
         google_ai_status = "operational" if test_response else "error"
     except:
         google_ai_status = "error"
     
     # Test Twitter agent connection
     try:
-        import requests
-        response = requests.get("http://localhost:5001/a2a/status", timeout=2)
+        response = http_client.get("http://localhost:5001/a2a/status", timeout=2)
         twitter_agent_status = "operational" if response.status_code == 200 else "error"
         twitter_data = response.json() if response.status_code == 200 else {}
     except:
@@ -2104,7 +2568,21 @@ def system_status():
                 'status': 'operational',
                 'message_queue_size': len(a2a_protocol.message_queue),
                 'connected_agents': ['twitter_agent']
-            }
+            },
+            'feed_poller': {
+                'status': 'operational' if feed_poller.thread and feed_poller.thread.is_alive() else 'stopped',
+                'sources_registered': len(feed_poller.sources),
+                'source_freshness': article_store.freshness(),
+                'circuit_breakers': breaker_states()
+            },
+            'http_client': http_client.stats(),
+            'content_cache': content_cache.stats(),
+            'extraction_profiles': extraction_profiles.stats(),
+            'extraction_pool': extraction_pool.stats(),
+            'domain_limiter': domain_limiter.stats(),
+            'gemini_response_cache': gemini_response_cache.stats(),
+            'contradiction_cache': contradiction_cache.stats(),
+            'gemini_limiter': gemini_limiter.stats()
         },
         'endpoints': {
             'dashboard': 'http://localhost:5000/',
@@ -2129,8 +2607,8 @@ if __name__ == '__main__':
     
     # Test the Gemini connection before starting server
     try:
-        test_model = DirectGeminiModel()
-        test_response = test_model.complete('Hello, can you respond with "Connection successful"?')
+        test_model = gemini_models.get()
+        test_response = test_model.complete('Hello, can you respond with "Connection successful"?', cache=False)
         if 'successful' in str(test_response).lower():
             print("✅ Gemini API connection test passed!")
         else:
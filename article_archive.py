@@ -0,0 +1,167 @@
+"""
+Persistent SQLite article archive
+Every polled feed is appended here so searches can look further back than what the RSS feeds currently list
+"""
+
+from datetime import datetime, timedelta
+import os
+import sqlite3
+import threading
+
+from article_index import tokenize, MIN_PREFIX_LENGTH
+from article_dedup import canonicalize_url, content_hash
+
+ARCHIVE_DB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "articles.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    canonical_url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    source TEXT NOT NULL,
+    category TEXT NOT NULL,
+    published TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    archived_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_source_published ON articles (source, published);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published);
+
+-- Normalized tokens (see article_index.tokenize) so Arabic variants match like the in-memory index
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (title, summary, tokenize = 'unicode61');
+"""
+
+
+class ArticleArchive:
+    """Thread-safe SQLite/FTS5 archive of every ingested article, keyed by canonical URL (the original link is kept as url)"""
+
+    def __init__(self, path: str = ARCHIVE_DB_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = None
+
+    def _connect(self):
+        """Open the database on first use (so importing the module never touches the disk)"""
+        if self.connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript(SCHEMA)
+        return self.connection
+
+    def append(self, source, entries) -> tuple:
+        """
+        Add a feed's entries to the archive; already stored URLs are only rewritten if their text changed
+
+        Args:
+            source: NewsSource the entries came from
+            entries: Parsed feed entries
+
+        Returns:
+            (number of newly archived articles, list of URLs whose title or summary changed)
+        """
+        rows = []
+        for entry in entries:
+            url = entry.get('link', '').strip()
+            canonical_url = canonicalize_url(url)
+            published_parsed = entry.get('published_parsed')
+            if not canonical_url or not published_parsed:
+                continue
+            title = entry.get('title', 'No title')
+            summary = entry.get('summary', 'No summary')[:500]
+            rows.append((url, canonical_url, title, summary, datetime(*published_parsed[:6]).isoformat()))
+
+        if not rows:
+            return 0, []
+
+        archived_at = datetime.now().isoformat()
+        added = 0
+        updated_urls = []
+        with self.lock:
+            connection = self._connect()
+            with connection:
+                for url, canonical_url, title, summary, published in rows:
+                    digest = content_hash(title, summary)
+                    cursor = connection.execute(
+                        "INSERT OR IGNORE INTO articles "
+                        "(url, canonical_url, title, summary, source, category, published, content_hash, archived_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (url, canonical_url, title, summary, source.name, source.category, published, digest, archived_at)
+                    )
+                    if cursor.rowcount:
+                        connection.execute(
+                            "INSERT INTO articles_fts (rowid, title, summary) VALUES (?, ?, ?)",
+                            (cursor.lastrowid, ' '.join(tokenize(title)), ' '.join(tokenize(summary)))
+                        )
+                        added += 1
+                        continue
+
+                    # Already archived - the outlet may have updated the story
+                    row_id, stored_digest = connection.execute(
+                        "SELECT id, content_hash FROM articles WHERE canonical_url = ?", (canonical_url,)
+                    ).fetchone()
+                    if stored_digest != digest:
+                        connection.execute(
+                            "UPDATE articles SET url = ?, title = ?, summary = ?, content_hash = ?, archived_at = ? "
+                            "WHERE id = ?",
+                            (url, title, summary, digest, archived_at, row_id)
+                        )
+                        connection.execute(
+                            "UPDATE articles_fts SET title = ?, summary = ? WHERE rowid = ?",
+                            (' '.join(tokenize(title)), ' '.join(tokenize(summary)), row_id)
+                        )
+                        updated_urls.append(url)
+        return added, updated_urls
+
+    def search(self, source_names: list, keywords: list, hours_back: int = 24, limit: int = 30) -> list:
+        """
+        Full-text search of archived articles
+
+        Args:
+            source_names: Only return articles from these sources
+            keywords: Raw query keywords; each matches any indexed token it prefixes
+                (tokens shorter than MIN_PREFIX_LENGTH only match exactly, as in FeedIndex.lookup)
+            hours_back: How many hours back to search
+            limit: Maximum number of rows to return
+
+        Returns:
+            List of article dictionaries (title, url, source, summary, published, category), newest first
+        """
+        tokens = set()
+        for keyword in keywords:
+            tokens |= tokenize(keyword)
+        if not tokens or not source_names:
+            return []
+
+        match_query = ' OR '.join(
+            f'"{token}"*' if len(token) >= MIN_PREFIX_LENGTH else f'"{token}"' for token in sorted(tokens)
+        )
+        cutoff = (datetime.now() - timedelta(hours=hours_back)).isoformat()
+        placeholders = ', '.join('?' for _ in source_names)
+
+        with self.lock:
+            rows = self._connect().execute(
+                "SELECT a.title, a.url, a.source, a.summary, a.published, a.category "
+                "FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid "
+                f"WHERE articles_fts MATCH ? AND a.source IN ({placeholders}) AND a.published >= ? "
+                "ORDER BY a.published DESC LIMIT ?",
+                (match_query, *source_names, cutoff, limit)
+            ).fetchall()
+
+        return [
+            {
+                'title': title,
+                'url': url,
+                'source': source,
+                'summary': summary,
+                'published': published,
+                'category': category
+            }
+            for title, url, source, summary, published, category in rows
+        ]
+
+
+article_archive = ArticleArchive()
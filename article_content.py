@@ -0,0 +1,195 @@
+"""
+Full-article content fetching for deep contradiction analysis
+Downloads and extracts article text, and prefetches every matched article in parallel
+Each outlet's article body selector is remembered in extraction_profiles so later pages skip the selector scan,
+and pages are parsed in extraction_pool worker processes so parallel fetches don't serialize on the GIL
+"""
+
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import re
+import threading
+
+from http_client import http_client
+from content_cache import content_cache
+from extraction_profiles import extraction_profiles, article_domain
+from html_extraction import CONTENT_SELECTORS
+from extraction_pool import extraction_pool
+from domain_limiter import domain_limiter
+
+# Parallel article downloads
+MAX_CONTENT_WORKERS = 8
+CONTENT_TIMEOUT_SECONDS = 10
+
+# Pages are streamed and cut off after CONTENT_MAX_BYTES; the article body is near the top of almost every page
+CONTENT_MAX_BYTES = 1_500_000
+CONTENT_CHUNK_BYTES = 64 * 1024
+
+# charset parameter of a Content-Type header (requests' response.encoding would report ISO-8859-1 when it's absent)
+HEADER_CHARSET = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+CONTENT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def extract_article_text(html: bytes, domain: str, encoding: str = None) -> tuple:
+    """
+    Extract the article body from a page in the extraction pool, trying the domain's profile selector first
+
+    Args:
+        html: Raw page HTML
+        domain: Article domain, used to pick the selector order
+        encoding: Charset named by the response's Content-Type header, if any
+
+    Returns:
+        (article text, selector that matched or None if the paragraph fallback was used)
+    """
+    return extraction_pool.extract(html, extraction_profiles.candidate_selectors(domain, CONTENT_SELECTORS),
+                                   encoding=encoding)
+
+
+def download_page(url: str):
+    """
+    Stream a page, stopping after CONTENT_MAX_BYTES (waits for the outlet's politeness budget first)
+
+    Returns:
+        (final URL after redirects, page bytes, charset named by the Content-Type header or None)
+    """
+    chunks = []
+    received = 0
+    with domain_limiter.slot(article_domain(url)):
+        with http_client.get(url, headers=CONTENT_HEADERS, timeout=CONTENT_TIMEOUT_SECONDS, stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(CONTENT_CHUNK_BYTES):
+                chunks.append(chunk)
+                received += len(chunk)
+                if received >= CONTENT_MAX_BYTES:
+                    print(f"✂️ Stopped reading {url[:50]} after {received // 1024} KB")
+                    break
+            charset = HEADER_CHARSET.search(response.headers.get('Content-Type', ''))
+            return response.url, b''.join(chunks), charset.group(1) if charset else None
+
+
+
+
+def fetch_article_content(url: str) -> dict:
+    """
+    Fetch the full content of a news article
+
+    Args:
+        url: URL of the article to fetch full content from
+
+    Returns:
+        Dictionary with url, content, length and success (or error) keys
+    """
+    cached = content_cache.get(url)
+    if cached is not None:
+        print(f"♻️ Using cached content for: {url[:50]}...")
+        return cached
+
+    print(f"📖 Fetching full content from: {url[:50]}...")
+
+    try:
+        final_url, html, encoding = download_page(url)
+
+        domain = article_domain(final_url or url)
+        article_text, selector = extract_article_text(html, domain, encoding)
+        extraction_profiles.record(domain, selector)
+
+        print(f"✅ Fetched {len(article_text)} characters")
+
+        result = {
+            'url': url,
+            'content': article_text,
+            'length': len(article_text),
+            'success': True
+        }
+        content_cache.put(url, result)
+        return result
+
+    except Exception as e:
+        print(f"❌ Error fetching {url}: {e}")
+        return {
+            'url': url,
+            'content': '',
+            'error': str(e),
+            'success': False
+        }
+
+
+class DomainFetchQueue:
+    """
+    Hands article fetches to the download pool no more than the domain limiter's in-flight cap per domain at a time
+
+    Extra URLs for a busy outlet wait here instead of holding pool threads inside domain_limiter.slot(), where they
+    would block other outlets' downloads queued behind them
+    """
+
+    def __init__(self, max_workers: int = MAX_CONTENT_WORKERS, per_domain: int = domain_limiter.max_in_flight):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="content-fetch")
+        self.per_domain = per_domain
+        self.lock = threading.Lock()
+        self.pending = defaultdict(deque)
+        self.running = defaultdict(int)
+
+    def submit(self, url: str) -> Future:
+        """Queue fetch_article_content(url) behind other fetches for the same domain"""
+        future = Future()
+        domain = article_domain(url)
+        with self.lock:
+            self.pending[domain].append((url, future))
+        self._dispatch(domain)
+        return future
+
+    def _dispatch(self, domain: str):
+        """Start the domain's queued fetches while it has free slots"""
+        with self.lock:
+            ready = []
+            while self.pending[domain] and self.running[domain] < self.per_domain:
+                ready.append(self.pending[domain].popleft())
+                self.running[domain] += 1
+            if not self.pending[domain]:
+                del self.pending[domain]
+
+        for url, future in ready:
+            self.executor.submit(self._run, domain, url, future)
+
+    def _run(self, domain: str, url: str, future: Future):
+        try:
+            result = fetch_article_content(url)
+        except Exception as e:
+            result = e
+        finally:
+            with self.lock:
+                self.running[domain] -= 1
+                if not self.running[domain]:
+                    del self.running[domain]
+            self._dispatch(domain)
+
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+_content_queue = DomainFetchQueue()
+
+
+def prefetch_article_contents(urls) -> dict:
+    """
+    Start downloading several articles in parallel
+
+    Args:
+        urls: Iterable of article URLs (duplicates are fetched once)
+
+    Returns:
+        Dictionary mapping each URL to a Future whose result is the fetch_article_content dictionary
+    """
+    futures = {}
+    for url in urls:
+        if url not in futures:
+            futures[url] = _content_queue.submit(url)
+
+    print(f"📥 Prefetching {len(futures)} articles in parallel...")
+    return futures
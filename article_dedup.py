@@ -0,0 +1,77 @@
+"""
+Cross-feed article deduplication
+Outlets syndicate the same story under several URLs - keep one representative per story before matching
+"""
+
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import hashlib
+
+from article_index import normalize_text, TOKEN
+
+# Query parameters that only track the click and never change the page
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'referrer', 'cmp', 'cmpid', 'ocid', 'ns_mchannel',
+    'ns_source', 'ns_campaign', 'ns_linkname', 'ns_fee', 'at_medium',
+    'smid', 'rss'
+}
+TRACKING_PREFIXES = ('utm_', 'at_', 'ns_')
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize an article URL: lowercase host without 'www.', no tracking parameters, fragment or trailing slash"""
+    if not url:
+        return ''
+
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return url.strip()
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    path = parts.path.rstrip('/') or '/'
+
+    return urlunsplit((parts.scheme.lower() or 'https', host, path, urlencode(sorted(query)), ''))
+
+
+def content_hash(title: str, summary: str) -> str:
+    """Hash of the normalized title and summary, identical for syndicated copies of a story ('' if there is no text)"""
+    text = ' '.join(TOKEN.findall(normalize_text(f"{title} {summary}")))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest() if text else ''
+
+
+def deduplicate_articles(articles: list) -> list:
+    """
+    Collapse syndicated copies of the same story
+
+    Args:
+        articles: Article dictionaries in priority order (the first of each duplicate group is kept)
+
+    Returns:
+        The first article per canonical URL or content hash, unchanged (the canonical URL is only the
+        comparison key - outlets don't necessarily serve it, so the original link is kept for fetching and display)
+    """
+    seen_urls = set()
+    seen_hashes = set()
+    unique_articles = []
+
+    for article in articles:
+        canonical_url = canonicalize_url(article.get('url', ''))
+        digest = content_hash(article.get('title', ''), article.get('summary', ''))
+
+        if (canonical_url and canonical_url in seen_urls) or (digest and digest in seen_hashes):
+            print(f"    🔁 Duplicate dropped: {article.get('source', 'unknown')} - {article.get('title', '')[:60]}")
+            continue
+
+        if canonical_url:
+            seen_urls.add(canonical_url)
+        if digest:
+            seen_hashes.add(digest)
+        unique_articles.append(article)
+
+    return unique_articles
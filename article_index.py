@@ -0,0 +1,82 @@
+"""
+Normalized keyword index for ingested articles
+Arabic and English text is normalized once when a feed is ingested, so keyword filtering is a lookup instead of a scan
+"""
+
+from bisect import bisect_left
+import re
+
+# Arabic diacritics (harakat, tanween, shadda, sukun, superscript alef) and tatweel
+ARABIC_DIACRITICS = re.compile(r'[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED\u0640]')
+
+ARABIC_LETTER_MAP = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',  # alef forms
+    'ة': 'ه',                              # taa marbuta
+    'ى': 'ي',                              # alef maqsura
+    'ؤ': 'و', 'ئ': 'ي',                    # hamza carriers
+})
+
+# Attached prefixes (conjunctions, prepositions, definite article), longest first
+ARABIC_PREFIXES = ('وال', 'بال', 'كال', 'فال', 'لل', 'ال', 'و', 'ب', 'ل', 'ف', 'ك')
+MIN_STEM_LENGTH = 3
+
+# Shorter query tokens must match exactly: "u" and "s" from "U.S." would otherwise prefix-match half the vocabulary
+MIN_PREFIX_LENGTH = 3
+
+HTML_TAG = re.compile(r'<[^>]+>')
+TOKEN = re.compile(r'\w+')
+ARABIC_CHAR = re.compile(r'[\u0600-\u06FF]')
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text, strip HTML tags and Arabic diacritics/tatweel, and unify Arabic letter variants"""
+    text = HTML_TAG.sub(' ', text or '')
+    text = ARABIC_DIACRITICS.sub('', text)
+    return text.translate(ARABIC_LETTER_MAP).lower()
+
+
+def tokenize(text: str) -> set:
+    """Split text into normalized tokens, adding prefix-stripped stems for Arabic words"""
+    tokens = set()
+    for token in TOKEN.findall(normalize_text(text)):
+        tokens.add(token)
+        if ARABIC_CHAR.match(token):
+            for prefix in ARABIC_PREFIXES:
+                if token.startswith(prefix) and len(token) - len(prefix) >= MIN_STEM_LENGTH:
+                    tokens.add(token[len(prefix):])
+                    break
+    return tokens
+
+
+class FeedIndex:
+    """Inverted index from normalized token to the positions of the feed entries that contain it"""
+
+    def __init__(self, entries):
+        self.postings = {}
+        for position, entry in enumerate(entries):
+            for token in tokenize(f"{entry.get('title', '')} {entry.get('summary', '')}"):
+                self.postings.setdefault(token, set()).add(position)
+        self.vocabulary = sorted(self.postings)
+
+    def lookup(self, keywords) -> set:
+        """
+        Find entries matching any of the keywords
+
+        Args:
+            keywords: Iterable of raw query keywords (normalized here the same way as the entries)
+
+        Returns:
+            Set of entry positions; a keyword matches every indexed token it is a prefix of
+            (so "israel" matches "israeli" and "غزة" matches "بغزة"), or only itself if shorter than MIN_PREFIX_LENGTH
+        """
+        positions = set()
+        for keyword in keywords:
+            for token in tokenize(keyword):
+                if len(token) < MIN_PREFIX_LENGTH:
+                    positions |= self.postings.get(token, set())
+                    continue
+                i = bisect_left(self.vocabulary, token)
+                while i < len(self.vocabulary) and self.vocabulary[i].startswith(token):
+                    positions |= self.postings[self.vocabulary[i]]
+                    i += 1
+        return positions
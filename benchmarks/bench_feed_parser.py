@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming feed parser against feedparser
+Compares parse time and peak memory on saved RSS/Atom fixtures
+
+Usage:
+    python benchmarks/bench_feed_parser.py            # benchmark fixtures in benchmarks/fixtures/feeds
+    python benchmarks/bench_feed_parser.py --save     # download every registered feed into the fixtures first
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser
+
+from fast_feed_parser import parse_feed
+from news_sources import get_sources, DEFAULT_ENTRY_CAP
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "feeds")
+
+
+def save_fixtures():
+    """Download every registered feed into the fixtures directory"""
+    import requests
+    from feed_ingestion import FEED_HEADERS
+
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for source in get_sources():
+        try:
+            response = requests.get(source.url, headers=FEED_HEADERS, timeout=source.timeout)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"❌ {source.name}: {e}")
+            continue
+        filename = source.name.lower().replace(' ', '_') + ".xml"
+        with open(os.path.join(FIXTURES_DIR, filename), 'wb') as f:
+            f.write(response.content)
+        print(f"✅ Saved {source.name} ({len(response.content)} bytes)")
+
+
+def synthetic_feed(kind: str, items: int = 300) -> bytes:
+    """Build a long RSS or Atom document, used when no fixtures have been saved"""
+    if kind == 'rss':
+        body = ''.join(
+            f"<item><title>Gaza update {i}</title><link>https://example.com/news/{i}</link>"
+            f"<description><![CDATA[<p>{'Report text. ' * 40}</p>]]></description>"
+            f"<pubDate>Mon, 06 May 2024 {i % 24:02d}:00:00 GMT</pubDate></item>"
+            for i in range(items)
+        )
+        return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Synthetic</title>{body}</channel></rss>'.encode()
+
+    body = ''.join(
+        f'<entry><title>غزة تحديث {i}</title><link rel="alternate" href="https://example.com/ar/{i}"/>'
+        f"<summary>{'نص التقرير. ' * 40}</summary><updated>2024-05-06T{i % 24:02d}:00:00Z</updated></entry>"
+        for i in range(items)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Synthetic</title>{body}</feed>'.encode()
+
+
+def load_fixtures() -> dict:
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.xml"))):
+        with open(path, 'rb') as f:
+            fixtures[os.path.basename(path)] = f.read()
+
+    if not fixtures:
+        print("⚠️ No saved fixtures found (run with --save); using synthetic feeds.")
+        print("   These numbers are not representative of the real outlets' feeds.\n")
+        fixtures = {'synthetic_rss.xml': synthetic_feed('rss'), 'synthetic_atom.xml': synthetic_feed('atom')}
+    return fixtures
+
+
+def measure(parse, content: bytes, repeat: int):
+    """Return (best wall time in ms, peak traced memory in KB, entry count) for one parser"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(content)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best * 1000, peak / 1024, len(result.entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--save', action='store_true', help='download the registered feeds into the fixtures first')
+    parser.add_argument('--entries', type=int, default=DEFAULT_ENTRY_CAP, help='entries the streaming parser keeps')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per parser (best is reported)')
+    args = parser.parse_args()
+
+    if args.save:
+        save_fixtures()
+
+    print(f"{'fixture':<28}{'size KB':>9}  {'feedparser ms':>14}{'KB':>9}{'n':>5}  {'streaming ms':>13}{'KB':>9}{'n':>5}  {'speedup':>8}")
+    for name, content in load_fixtures().items():
+        full_ms, full_kb, full_n = measure(feedparser.parse, content, args.repeat)
+        fast_ms, fast_kb, fast_n = measure(lambda data: parse_feed(data, args.entries), content, args.repeat)
+        print(f"{name:<28}{len(content) / 1024:>9.1f}  {full_ms:>14.2f}{full_kb:>9.0f}{full_n:>5}  "
+              f"{fast_ms:>13.2f}{fast_kb:>9.0f}{fast_n:>5}  {full_ms / max(fast_ms, 1e-6):>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
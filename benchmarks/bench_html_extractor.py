@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark the lxml article extractor against BeautifulSoup html.parser
+Compares extraction time, peak memory and the extracted text on saved article pages
+
+Usage:
+    python benchmarks/bench_html_extractor.py            # benchmark pages in benchmarks/fixtures/pages
+    python benchmarks/bench_html_extractor.py --save     # download the latest article of every registered outlet first
+
+Peak memory is measured with tracemalloc, which sees Python objects only: BeautifulSoup's tree is counted in
+full, lxml's libxml2 tree is not, so read the KB columns as Python-heap pressure rather than total memory.
+"""
+
+import argparse
+from difflib import SequenceMatcher
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_extraction import extract_with_bs4, extract_with_lxml, CONTENT_SELECTORS
+from news_sources import get_sources
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pages")
+
+
+def save_fixtures():
+    """Download the newest article of every registered outlet into the fixtures directory"""
+    import requests
+    from fast_feed_parser import parse_feed
+    from feed_ingestion import FEED_HEADERS
+    from article_content import CONTENT_HEADERS
+
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for source in get_sources():
+        try:
+            feed = requests.get(source.url, headers=FEED_HEADERS, timeout=source.timeout)
+            feed.raise_for_status()
+            entries = parse_feed(feed.content, 1).entries
+            if not entries:
+                raise ValueError("feed has no entries")
+            page = requests.get(entries[0]['link'], headers=CONTENT_HEADERS, timeout=source.timeout)
+            page.raise_for_status()
+        except Exception as e:
+            print(f"❌ {source.name}: {e}")
+            continue
+        filename = source.name.lower().replace(' ', '_') + ".html"
+        with open(os.path.join(FIXTURES_DIR, filename), 'wb') as f:
+            f.write(page.content)
+        print(f"✅ Saved {source.name} article ({len(page.content)} bytes)")
+
+
+def synthetic_page(paragraphs: int = 60) -> bytes:
+    """Build a script-heavy news page, used when no fixtures have been saved"""
+    state = '"key": 1, ' * 200
+    scripts = ''.join(f"<script>window.__state{i} = {{{state}}};</script>" for i in range(40))
+    navigation = ''.join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(200))
+    body = ''.join(f"<p>Paragraph {i} of the report on Gaza. {'Reported detail. ' * 20}</p>" for i in range(paragraphs))
+    return (
+        f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>Synthetic</title>{scripts}</head>'
+        f'<body><header><nav><ul>{navigation}</ul></nav></header>'
+        f'<main><div class="story-body"><h1>Synthetic article</h1>{body}</div></main>'
+        f'<footer><nav><ul>{navigation}</ul></nav></footer></body></html>'
+    ).encode()
+
+
+def no_meta_charset_page(paragraphs: int = 30) -> bytes:
+    """A UTF-8 Arabic page without <meta charset>, which lxml would read as Latin-1 unless the encoding is detected"""
+    body = ''.join(f"<p>الفقرة {i}: قصف على مدينة غزة وسقوط ضحايا بحسب وزارة الصحة.</p>" for i in range(paragraphs))
+    return (
+        f'<!DOCTYPE html><html lang="ar" dir="rtl"><head><title>بدون ترميز</title></head>'
+        f'<body><article><h1>تقرير</h1>{body}</article></body></html>'
+    ).encode('utf-8')
+
+
+def load_fixtures() -> dict:
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.html"))):
+        with open(path, 'rb') as f:
+            fixtures[os.path.basename(path)] = f.read()
+
+    if not fixtures:
+        print("⚠️ No saved fixtures found (run with --save); using a synthetic page.")
+        print("   These numbers are not representative of the real outlets' article pages.\n")
+        fixtures = {'synthetic.html': synthetic_page()}
+
+    # Always checked: both engines must decode a page that doesn't declare its charset the same way
+    fixtures['no_meta_charset.html'] = no_meta_charset_page()
+    return fixtures
+
+
+def measure(extract, content: bytes, repeat: int):
+    """Return (best wall time in ms, peak traced memory in KB, extracted text) for one engine"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract(content, CONTENT_SELECTORS)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    text, _ = extract(content, CONTENT_SELECTORS)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best * 1000, peak / 1024, text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--save', action='store_true', help='download an article per registered outlet first')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per engine (best is reported)')
+    args = parser.parse_args()
+
+    if args.save:
+        save_fixtures()
+
+    fixtures = load_fixtures()
+    print(f"{'fixture':<28}{'size KB':>9}  {'bs4 ms':>9}{'KB':>9}{'chars':>7}  {'lxml ms':>9}{'KB':>9}{'chars':>7}  "
+          f"{'speedup':>8}{'same text':>11}")
+    for name, content in fixtures.items():
+        bs4_ms, bs4_kb, bs4_text = measure(extract_with_bs4, content, args.repeat)
+        lxml_ms, lxml_kb, lxml_text = measure(extract_with_lxml, content, args.repeat)
+        similarity = SequenceMatcher(None, bs4_text, lxml_text).ratio() if bs4_text or lxml_text else 1.0
+        print(f"{name:<28}{len(content) / 1024:>9.1f}  {bs4_ms:>9.2f}{bs4_kb:>9.0f}{len(bs4_text):>7}  "
+              f"{lxml_ms:>9.2f}{lxml_kb:>9.0f}{len(lxml_text):>7}  {bs4_ms / max(lxml_ms, 1e-6):>7.1f}x{similarity:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
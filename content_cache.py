@@ -0,0 +1,30 @@
+"""
+Two-tier cache for fetched article content
+An in-memory LRU in front of a gzip-compressed on-disk store, keyed by canonical URL with a TTL
+"""
+
+import os
+
+from article_dedup import canonicalize_url
+from disk_cache import TwoTierCache
+
+CONTENT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "article_content")
+CONTENT_CACHE_TTL_SECONDS = 6 * 3600
+CONTENT_CACHE_MEMORY_ITEMS = 256
+CONTENT_CACHE_MAX_DISK_BYTES = 200 * 1024 * 1024
+
+
+class ContentCache(TwoTierCache):
+    """Thread-safe LRU + compressed disk cache of fetch_article_content results, keyed by canonical URL"""
+
+    name = 'content cache'
+
+    def __init__(self, directory: str = CONTENT_CACHE_DIR, ttl: float = CONTENT_CACHE_TTL_SECONDS,
+                 memory_items: int = CONTENT_CACHE_MEMORY_ITEMS, max_disk_bytes: int = CONTENT_CACHE_MAX_DISK_BYTES):
+        super().__init__(directory, ttl, memory_items, max_disk_bytes)
+
+    def _key(self, url: str) -> str:
+        return canonicalize_url(url)
+
+
+content_cache = ContentCache()
@@ -0,0 +1,103 @@
+"""
+Token-budgeted article condensation for AI prompts
+Scores paragraphs by overlap with what the matched pair shares and by density of numbers and names,
+then packs the best ones into a fixed token budget instead of keeping the first N characters
+"""
+
+import re
+
+from article_index import tokenize
+
+# Prompt budget per article body (~2,400 characters of English, the size of the old 2,500-character cut)
+ARTICLE_TOKEN_BUDGET = 600
+
+# Budget for article text returned to the agent by the fetch_full_article_content tool (the old 4,000-character cut)
+TOOL_CONTENT_TOKEN_BUDGET = 1000
+
+# Rough characters-per-token for budget estimates (Gemini averages ~4 for English prose)
+CHARS_PER_TOKEN = 4
+
+# Paragraphs shorter than this are captions, bylines or share buttons
+MIN_PARAGRAPH_CHARS = 40
+
+# Score weights: focus-term hits, numbers and names per 100 characters, and a small nudge for the lede
+FOCUS_WEIGHT = 3.0
+NUMBER_WEIGHT = 2.0
+NAME_WEIGHT = 1.0
+LEDE_BONUS = 1.0
+
+NUMBER = re.compile(r'\d+(?:[.,]\d+)*')
+CAPITALIZED_WORD = re.compile(r"\b[A-Z][a-zA-Z'-]+")
+BOILERPLATE = re.compile(
+    r'cookie|subscribe|newsletter|sign up|all rights reserved|follow us|read more|advertisement|'
+    r'اشترك|تابعونا|جميع الحقوق محفوظة|اقرأ أيضا',
+    re.IGNORECASE
+)
+STOP_TOKENS = {'the', 'and', 'for', 'with', 'from', 'that', 'this', 'was', 'were', 'are', 'has', 'have', 'said'}
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate used for prompt budgeting"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def focus_tokens(terms) -> set:
+    """Normalized, meaningful tokens of the pair's shared elements (and any other focus terms)"""
+    tokens = set()
+    for term in terms:
+        tokens |= {token for token in tokenize(str(term)) if len(token) >= 3 and token not in STOP_TOKENS}
+    return tokens
+
+
+def score_paragraph(paragraph: str, focus: set, position: int) -> float:
+    """Relevance of one paragraph: focus-term overlap plus density of numbers and proper names"""
+    if len(paragraph) < MIN_PARAGRAPH_CHARS or BOILERPLATE.search(paragraph):
+        return 0.0
+
+    per_100_chars = 100 / len(paragraph)
+    score = FOCUS_WEIGHT * len(focus & tokenize(paragraph)) if focus else 0.0
+    score += NUMBER_WEIGHT * len(NUMBER.findall(paragraph)) * per_100_chars
+    # The first word of a paragraph is capitalized anyway
+    score += NAME_WEIGHT * max(len(CAPITALIZED_WORD.findall(paragraph)) - 1, 0) * per_100_chars
+    if position == 0:
+        score += LEDE_BONUS
+    return score
+
+
+def condense_text(text: str, focus_terms=(), token_budget: int = ARTICLE_TOKEN_BUDGET) -> str:
+    """
+    Keep the most informative paragraphs of an article within a token budget
+
+    Args:
+        text: Article text with one paragraph per line
+        focus_terms: Terms the analysis centres on (the matched pair's shared_elements, titles)
+        token_budget: Maximum estimated tokens to return
+
+    Returns:
+        The selected paragraphs in their original order, one per line
+    """
+    paragraphs = [paragraph.strip() for paragraph in (text or '').split('\n') if paragraph.strip()]
+    if estimate_tokens('\n'.join(paragraphs)) <= token_budget:
+        return '\n'.join(paragraphs)
+
+    focus = focus_tokens(focus_terms)
+    scores = [score_paragraph(paragraph, focus, index) for index, paragraph in enumerate(paragraphs)]
+    ranked = sorted(range(len(paragraphs)), key=lambda index: (-scores[index], index))
+
+    def pack(candidates):
+        selected = []
+        remaining = token_budget
+        for index in candidates:
+            cost = estimate_tokens(paragraphs[index])
+            if cost <= remaining:
+                selected.append(index)
+                remaining -= cost
+        return selected
+
+    # Zero-score paragraphs (boilerplate, captions) don't fill leftover budget; they're only used if nothing scored
+    selected = pack([index for index in ranked if scores[index] > 0]) or pack(ranked)
+
+    if not selected:
+        # A single wall of text with no paragraph breaks: keep its best-scoring start
+        return paragraphs[ranked[0]][:token_budget * CHARS_PER_TOKEN]
+    return '\n'.join(paragraphs[index] for index in sorted(selected))
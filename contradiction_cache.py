@@ -0,0 +1,37 @@
+"""
+Cache of finished pair-level contradiction analyses
+Keyed by both article URLs, their content hashes and the prompt version, so only pairs whose text changed go back to Gemini
+"""
+
+import hashlib
+import os
+
+from article_dedup import canonicalize_url
+from disk_cache import TwoTierCache
+
+CONTRADICTION_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "contradictions")
+CONTRADICTION_CACHE_TTL_SECONDS = 24 * 3600
+CONTRADICTION_CACHE_MEMORY_ITEMS = 64
+CONTRADICTION_CACHE_MAX_DISK_BYTES = 50 * 1024 * 1024
+
+
+def pair_key(western_url: str, arabic_url: str, western_hash: str, arabic_hash: str, prompt_version: str) -> str:
+    """Identity of one pair analysis: which articles, which version of their text, and which prompt produced it"""
+    material = '\n'.join((
+        canonicalize_url(western_url), canonicalize_url(arabic_url), western_hash, arabic_hash, prompt_version
+    ))
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class ContradictionCache(TwoTierCache):
+    """Thread-safe LRU + compressed disk cache of analyze_pair_contradictions results, keyed by pair_key"""
+
+    name = 'contradiction cache'
+
+    def __init__(self, directory: str = CONTRADICTION_CACHE_DIR, ttl: float = CONTRADICTION_CACHE_TTL_SECONDS,
+                 memory_items: int = CONTRADICTION_CACHE_MEMORY_ITEMS,
+                 max_disk_bytes: int = CONTRADICTION_CACHE_MAX_DISK_BYTES):
+        super().__init__(directory, ttl, memory_items, max_disk_bytes)
+
+
+contradiction_cache = ContradictionCache()
@@ -0,0 +1,168 @@
+"""
+Two-tier cache building block
+An in-memory LRU in front of a directory of gzip-compressed JSON files, with a TTL and a disk size cap
+"""
+
+from collections import OrderedDict
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+# Once the directory grows past its cap, sweep it down to this fraction of the cap
+DISK_SWEEP_TARGET = 0.9
+
+
+class TwoTierCache:
+    """Thread-safe LRU + compressed disk cache of JSON-serializable values"""
+
+    name = 'cache'
+
+    def __init__(self, directory: str, ttl: float, memory_items: int, max_disk_bytes: int = None):
+        self.directory = directory
+        self.ttl = ttl
+        self.memory_items = memory_items
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_bytes = None  # measured on the first write
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+        self.counters = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'invalidations': 0, 'evictions': 0}
+
+    def _key(self, key: str) -> str:
+        """Normalize a caller's key (subclasses canonicalize URLs etc.)"""
+        return key
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + ".json.gz")
+
+    def _remember(self, key: str, stored_at: float, value):
+        """Insert into the in-memory tier, evicting the least recently used entries (call with the lock held)"""
+        self.memory[key] = (stored_at, value)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_items:
+            self.memory.popitem(last=False)
+
+    def get(self, key: str):
+        """Return the cached value, or None if it is missing or older than the TTL"""
+        key = self._key(key)
+        now = time.time()
+
+        with self.lock:
+            cached = self.memory.get(key)
+            if cached and now - cached[0] < self.ttl:
+                self.memory.move_to_end(key)
+                self.counters['memory_hits'] += 1
+                return cached[1]
+            self.memory.pop(key, None)
+
+        try:
+            with gzip.open(self._path(key), 'rt', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            record = None
+
+        with self.lock:
+            if record and now - record['stored_at'] < self.ttl:
+                self._remember(key, record['stored_at'], record['value'])
+                self.counters['disk_hits'] += 1
+                return record['value']
+            self.counters['misses'] += 1
+            return None
+
+    def put(self, key: str, value):
+        """Store a value in both tiers"""
+        key = self._key(key)
+        stored_at = time.time()
+
+        with self.lock:
+            self._remember(key, stored_at, value)
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump({'key': key, 'stored_at': stored_at, 'value': value}, f, ensure_ascii=False)
+            written = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Could not write {self.name} entry for {key[:50]}: {e}")
+            return
+
+        self._account_disk_write(written)
+
+    def _account_disk_write(self, written: int):
+        """Track the directory size and sweep it once it exceeds max_disk_bytes"""
+        if not self.max_disk_bytes:
+            return
+
+        with self.lock:
+            if self.disk_bytes is None:
+                self.disk_bytes = self._directory_size()
+            else:
+                self.disk_bytes += written
+            over_budget = self.disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self.sweep()
+
+    def _directory_size(self) -> int:
+        try:
+            return sum(entry.stat().st_size for entry in os.scandir(self.directory) if entry.is_file())
+        except OSError:
+            return 0
+
+    def sweep(self):
+        """Delete expired files, then the least recently written ones until the directory is under budget"""
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.is_file() and entry.name.endswith('.json.gz')]
+        except OSError:
+            return
+
+        now = time.time()
+        files = sorted((entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in entries)
+        total = sum(size for _, size, _ in files)
+        target = (self.max_disk_bytes or total) * DISK_SWEEP_TARGET
+
+        removed = 0
+        for mtime, size, path in files:
+            if now - mtime < self.ttl and total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        with self.lock:
+            self.disk_bytes = total
+            self.counters['evictions'] += removed
+        if removed:
+            print(f"🧹 Evicted {removed} {self.name} files ({total // 1024} KB left)")
+
+    def invalidate(self, key: str) -> bool:
+        """Drop a key from both tiers; returns whether it was cached"""
+        key = self._key(key)
+        with self.lock:
+            was_cached = self.memory.pop(key, None) is not None
+            self.counters['invalidations'] += 1
+
+        try:
+            os.remove(self._path(key))
+            was_cached = True
+        except OSError:
+            pass
+        return was_cached
+
+    def stats(self) -> dict:
+        """Hit/miss counters and hit rate for both tiers"""
+        with self.lock:
+            counters = dict(self.counters)
+            counters['memory_entries'] = len(self.memory)
+            counters['disk_bytes'] = self.disk_bytes
+
+        lookups = counters['memory_hits'] + counters['disk_hits'] + counters['misses']
+        counters['hit_rate'] = round((counters['memory_hits'] + counters['disk_hits']) / lookups, 3) if lookups else 0.0
+        return counters
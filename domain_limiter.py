@@ -0,0 +1,113 @@
+"""
+Per-domain politeness limits for article fetches
+A token bucket and an in-flight cap per outlet; requests over budget wait their turn instead of failing
+"""
+
+from contextlib import contextmanager
+import threading
+import time
+
+# Sustained requests per second and burst size per domain, and concurrent requests per domain
+DOMAIN_REQUESTS_PER_SECOND = 1.0
+DOMAIN_BURST = 3
+DOMAIN_MAX_IN_FLIGHT = 2
+
+
+class DomainBudget:
+    """Token bucket and in-flight count for one domain (guarded by the limiter's condition)"""
+
+    def __init__(self, burst: int):
+        self.tokens = float(burst)
+        self.refilled_at = time.monotonic()
+        self.in_flight = 0
+        self.waiting = 0
+
+
+class DomainLimiter:
+    """Thread-safe per-domain rate limiter that queues callers until their domain has budget"""
+
+    def __init__(self, rate: float = DOMAIN_REQUESTS_PER_SECOND, burst: int = DOMAIN_BURST,
+                 max_in_flight: int = DOMAIN_MAX_IN_FLIGHT):
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.condition = threading.Condition()
+        self.budgets = {}
+        self.counters = {'requests': 0, 'queued': 0, 'seconds_queued': 0.0}
+
+    def _refill(self, budget: DomainBudget, now: float):
+        budget.tokens = min(self.burst, budget.tokens + (now - budget.refilled_at) * self.rate)
+        budget.refilled_at = now
+
+    def acquire(self, domain: str) -> float:
+        """
+        Block until the domain has a free in-flight slot and a token, then take both
+
+        Args:
+            domain: Article domain (see extraction_profiles.article_domain)
+
+        Returns:
+            Seconds spent queued
+        """
+        started = time.monotonic()
+        with self.condition:
+            budget = self.budgets.setdefault(domain, DomainBudget(self.burst))
+            budget.waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(budget, now)
+                    if budget.in_flight < self.max_in_flight and budget.tokens >= 1:
+                        break
+                    # Woken early by release(); otherwise sleep until the next token is due
+                    timeout = None if budget.in_flight >= self.max_in_flight else (1 - budget.tokens) / self.rate
+                    self.condition.wait(timeout)
+            finally:
+                budget.waiting -= 1
+
+            budget.tokens -= 1
+            budget.in_flight += 1
+            waited = time.monotonic() - started
+            self.counters['requests'] += 1
+            if waited > 0.01:
+                self.counters['queued'] += 1
+                self.counters['seconds_queued'] += waited
+            return waited
+
+    def release(self, domain: str):
+        """Free the domain's in-flight slot taken by acquire"""
+        with self.condition:
+            self.budgets[domain].in_flight -= 1
+            self.condition.notify_all()
+
+    @contextmanager
+    def slot(self, domain: str):
+        """Hold one of the domain's request slots for the duration of a with-block"""
+        waited = self.acquire(domain)
+        if waited > 1:
+            print(f"⏳ Waited {waited:.1f}s for a {domain} request slot")
+        try:
+            yield
+        finally:
+            self.release(domain)
+
+    def stats(self) -> dict:
+        """Limits, totals and the domains that currently have requests running or queued"""
+        with self.condition:
+            busy = {
+                domain: {'in_flight': budget.in_flight, 'queued': budget.waiting}
+                for domain, budget in self.budgets.items() if budget.in_flight or budget.waiting
+            }
+            counters = dict(self.counters)
+
+        counters['seconds_queued'] = round(counters['seconds_queued'], 2)
+        return {
+            'requests_per_second': self.rate,
+            'burst': self.burst,
+            'max_in_flight': self.max_in_flight,
+            'busy_domains': busy,
+            **counters
+        }
+
+
+domain_limiter = DomainLimiter()
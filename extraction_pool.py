@@ -0,0 +1,101 @@
+"""
+Process pool for article text extraction
+HTML parsing holds the GIL, so pages are parsed in worker processes: raw bytes go in, only the extracted text comes back
+"""
+
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+import sys
+import threading
+
+from html_extraction import extract_text, ARTICLE_TEXT_CHARS
+
+# forkserver/spawn workers re-import the launching script as __mp_main__. Under gunicorn that is gunicorn's own
+# launcher, but with `python app.py` every worker would load (and start) a whole second copy of the app.
+SERVED_BY_GUNICORN = 'gunicorn' in sys.modules
+
+# Worker processes (default: one per core under gunicorn; none with `python app.py` or on a single-core host,
+# where the pool would only add IPC); set EXTRACTION_PROCESSES=N to override, 0 to parse on the calling thread
+CPU_COUNT = os.cpu_count() or 1
+EXTRACTION_PROCESSES = int(os.environ.get(
+    'EXTRACTION_PROCESSES', CPU_COUNT if CPU_COUNT > 1 and SERVED_BY_GUNICORN else 0
+))
+EXTRACTION_TIMEOUT_SECONDS = 15
+
+
+def _start_context():
+    """Start workers from a clean forkserver rather than forking the threaded server process"""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload(['html_extraction'])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+class ExtractionPool:
+    """Lazily started, fork-aware pool of extraction worker processes"""
+
+    def __init__(self, processes: int = EXTRACTION_PROCESSES):
+        self.processes = processes
+        self.lock = threading.Lock()
+        self.executor = None
+        self.pid = None
+        self.counters = {'pooled': 0, 'inline': 0, 'pool_restarts': 0, 'timeouts': 0}
+
+    def _get_executor(self):
+        """Return this process's executor, creating it on first use (and again after a fork)"""
+        with self.lock:
+            if self.executor is None or self.pid != os.getpid():
+                self.executor = ProcessPoolExecutor(max_workers=self.processes, mp_context=_start_context())
+                self.pid = os.getpid()
+            return self.executor
+
+    def _discard(self, executor):
+        """Drop a broken or stuck executor so the next call starts a fresh one"""
+        with self.lock:
+            if self.executor is executor:
+                self.executor = None
+                self.counters['pool_restarts'] += 1
+        # shutdown() alone would leave a worker stuck on a pathological page running (and holding its slot)
+        for process in list((getattr(executor, '_processes', None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def extract(self, html: bytes, selectors: list, limit: int = ARTICLE_TEXT_CHARS, encoding: str = None) -> tuple:
+        """
+        Extract article text in a worker process (same arguments and result as html_extraction.extract_text)
+
+        Falls back to parsing on the calling thread if the pool is disabled, a worker died or the page took longer
+        than EXTRACTION_TIMEOUT_SECONDS (the pool is then recycled so stuck workers can't fill it)
+        """
+        if self.processes > 0:
+            executor = self._get_executor()
+            try:
+                result = executor.submit(extract_text, html, selectors, limit, encoding).result(timeout=EXTRACTION_TIMEOUT_SECONDS)
+                with self.lock:
+                    self.counters['pooled'] += 1
+                return result
+            except BrokenProcessPool as e:
+                print(f"⚠️ Extraction pool broke ({e}), parsing inline and restarting it")
+                self._discard(executor)
+            except FuturesTimeoutError:
+                print(f"⚠️ Extraction took over {EXTRACTION_TIMEOUT_SECONDS}s, parsing inline and recycling the pool")
+                with self.lock:
+                    self.counters['timeouts'] += 1
+                self._discard(executor)
+
+        with self.lock:
+            self.counters['inline'] += 1
+        return extract_text(html, selectors, limit, encoding)
+
+    def stats(self) -> dict:
+        with self.lock:
+            counters = dict(self.counters)
+            counters['processes'] = self.processes
+            counters['running'] = self.executor is not None and self.pid == os.getpid()
+        return counters
+
+
+extraction_pool = ExtractionPool()
@@ -0,0 +1,99 @@
+"""
+Per-domain article extraction profiles
+Remembers which CSS selector held the article body on each outlet so later fetches try it first
+"""
+
+import json
+import os
+import threading
+from urllib.parse import urlsplit
+
+from news_sources import declared_content_selectors
+
+# Learned selectors, persisted so a restart doesn't have to rediscover every outlet
+EXTRACTION_PROFILES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "extraction_profiles.json")
+
+
+def article_domain(url: str) -> str:
+    """Registrable-looking host of an article URL ('https://www.bbc.com/news/x' -> 'bbc.com')"""
+    host = urlsplit(url).netloc.lower().split('@')[-1].split(':')[0]
+    return host[4:] if host.startswith('www.') else host
+
+
+class ExtractionProfiles:
+    """Thread-safe map of domain -> content selector, seeded from news_sources and learned from fetches"""
+
+    def __init__(self, path: str = EXTRACTION_PROFILES_FILE, declared: dict = None):
+        self.path = path
+        self.lock = threading.Lock()
+        self.declared = declared_content_selectors() if declared is None else declared
+        self.learned = self._load()
+        self.counters = {'profile_hits': 0, 'profile_misses': 0}
+
+    def _load(self) -> dict:
+        """Load the persisted profiles, starting empty if they are missing or corrupt"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """Write the profiles atomically (call with the lock held)"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.learned, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not persist extraction profiles: {e}")
+
+    def profile_selector(self, domain: str):
+        """The selector to try first for a domain (learned beats declared), or None if it has no profile"""
+        with self.lock:
+            return self.learned.get(domain) or self.declared.get(domain)
+
+    def candidate_selectors(self, domain: str, default_selectors: list) -> list:
+        """Selectors to try for a domain: its profile first, then the generic list"""
+        selector = self.profile_selector(domain)
+        if not selector:
+            return list(default_selectors)
+        return [selector] + [candidate for candidate in default_selectors if candidate != selector]
+
+    def record(self, domain: str, selector):
+        """
+        Remember the selector that produced the article text for a domain
+
+        Args:
+            domain: Article domain (see article_domain)
+            selector: Selector that matched, or None if only the paragraph fallback found text
+        """
+        if not domain:
+            return
+
+        with self.lock:
+            profile = self.learned.get(domain) or self.declared.get(domain)
+            self.counters['profile_hits' if profile and profile == selector else 'profile_misses'] += 1
+
+            if selector and self.learned.get(domain) != selector:
+                self.learned[domain] = selector
+                self._save()
+            elif not selector and domain in self.learned:
+                # The learned selector stopped matching (site redesign) - rediscover it next time
+                del self.learned[domain]
+                self._save()
+
+    def stats(self) -> dict:
+        """Profile counts and how often the first selector tried was the right one"""
+        with self.lock:
+            counters = dict(self.counters)
+            counters['declared_domains'] = len(self.declared)
+            counters['learned_domains'] = len(self.learned)
+
+        extractions = counters['profile_hits'] + counters['profile_misses']
+        counters['hit_rate'] = round(counters['profile_hits'] / extractions, 3) if extractions else 0.0
+        return counters
+
+
+extraction_profiles = ExtractionProfiles()
@@ -0,0 +1,118 @@
+"""
+Streaming RSS/Atom parser for the ingestion hot path
+Reads only as many entries as a source can use and falls back to feedparser for anything it can't handle
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+import xml.etree.ElementTree as ET
+
+import feedparser
+
+# Item elements for RSS 2.0, RSS 1.0 (RDF) and Atom, by local name
+ENTRY_TAGS = {'item', 'entry'}
+
+# Local element name -> feedparser entry field
+FIELD_TAGS = {
+    'title': 'title',
+    'link': 'link',
+    'description': 'summary',
+    'summary': 'summary',
+    'pubDate': 'published',
+    'published': 'published',
+    'date': 'published',      # dc:date
+    'updated': 'updated',
+}
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _parse_date(value: str):
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom, dc:date) date into a UTC struct_time like feedparser does"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).timetuple()
+
+
+def _element_to_entry(element) -> feedparser.FeedParserDict:
+    """Convert an <item>/<entry> element into a feedparser-style entry"""
+    entry = feedparser.FeedParserDict()
+    for child in element:
+        field = FIELD_TAGS.get(_local_name(child.tag))
+        if field is None:
+            continue
+        if field == 'link' and not (child.text or '').strip():
+            # Atom: <link rel="alternate" href="..."/>
+            if child.get('rel', 'alternate') == 'alternate' and 'link' not in entry:
+                entry['link'] = child.get('href', '')
+            continue
+        if field in entry:
+            continue
+        entry[field] = (child.text or '').strip()
+
+    # Atom entries often only carry <updated>
+    if 'published' not in entry and 'updated' in entry:
+        entry['published'] = entry['updated']
+    published_parsed = _parse_date(entry.get('published'))
+    if published_parsed:
+        entry['published_parsed'] = published_parsed
+    return entry
+
+
+def parse_feed_fast(content: bytes, max_entries: int) -> feedparser.FeedParserDict:
+    """
+    Parse the first entries of an RSS or Atom document without building the whole tree
+
+    Args:
+        content: Raw feed bytes
+        max_entries: Stop reading once this many entries have been collected
+
+    Returns:
+        feedparser-style result with an 'entries' list
+
+    Raises:
+        ET.ParseError: If the document isn't well-formed XML (up to the point where parsing stopped)
+        ValueError: If no RSS/Atom entries were found
+    """
+    entries = []
+    open_elements = []
+    for event, element in ET.iterparse(BytesIO(content), events=('start', 'end')):
+        if event == 'start':
+            open_elements.append(element)
+            continue
+
+        open_elements.pop()
+        if _local_name(element.tag) in ENTRY_TAGS:
+            entries.append(_element_to_entry(element))
+            # Detach parsed items so memory stays flat on long feeds
+            if open_elements:
+                open_elements[-1].remove(element)
+            if len(entries) >= max_entries:
+                break
+
+    if not entries:
+        raise ValueError("no RSS/Atom entries found")
+    return feedparser.FeedParserDict(entries=entries, fast_parser=True)
+
+
+def parse_feed(content: bytes, max_entries: int = None) -> feedparser.FeedParserDict:
+    """Parse a feed with the streaming parser when a cap is given, falling back to feedparser for malformed feeds"""
+    if max_entries:
+        try:
+            return parse_feed_fast(content, max_entries)
+        except (ET.ParseError, ValueError) as e:
+            print(f"    ↩️ Streaming parser fell back to feedparser: {e}")
+    return feedparser.parse(content)
@@ -0,0 +1,567 @@
+"""
+Concurrent RSS ingestion for the Gaza Media Fact-Check agent
+Fetches every source declared in news_sources at once so a search pays for the slowest feed, not the sum of all of them
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from datetime import datetime, timedelta
+import os
+import json
+import time
+import threading
+import sqlite3
+import feedparser
+
+from news_sources import NewsSource
+from article_index import FeedIndex
+from article_dedup import deduplicate_articles
+from article_archive import article_archive
+from fast_feed_parser import parse_feed
+from http_client import http_client
+from content_cache import content_cache
+
+# Bounded parallelism for RSS downloads (per-feed timeouts live in the source registry)
+MAX_FEED_WORKERS = 8
+
+# Parse only the first entry_cap entries with the streaming parser (feedparser is still used for malformed feeds)
+USE_FAST_FEED_PARSER = True
+
+FEED_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; GazaFactCheckAgent/1.0; +http://localhost:5000/api/docs)'
+}
+
+# Conditional-GET cache, persisted so a restart doesn't re-download every feed
+FEED_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "feed_cache.json")
+
+# Background poller tick; the store is considered stale after FEED_MAX_AGE_SECONDS
+POLL_TICK_SECONDS = 1
+FEED_MAX_AGE_SECONDS = 900
+
+# Circuit breaker: after BREAKER_FAILURE_THRESHOLD consecutive failures or slow responses
+# a source is skipped for BREAKER_COOLDOWN_SECONDS, then probed again with a single request
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 120
+SLOW_RESPONSE_FRACTION = 0.8  # of the source's timeout
+
+# Overall budget for inline ingestion; sources still running after it are reported as missing
+INGESTION_DEADLINE_SECONDS = 8
+
+# Searches further back than this are answered from the on-disk archive instead of the live feeds
+LIVE_WINDOW_HOURS = 24
+
+# Shared pool so concurrent searches don't each spin up their own threads
+_feed_executor = ThreadPoolExecutor(max_workers=MAX_FEED_WORKERS, thread_name_prefix="feed-fetch")
+
+
+class SourceUnavailableError(Exception):
+    """Raised when a source is skipped because its circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """Per-source breaker that stops calling a feed that keeps failing or responding slowly"""
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, cooldown: float = BREAKER_COOLDOWN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0
+        self.lock = threading.Lock()
+    
+    def allow_request(self) -> bool:
+        """Whether a fetch may go out now; lets exactly one probe through once the cool-down expires"""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.time() - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+    
+    def record_success(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+    
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.time()
+
+
+circuit_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(source_name: str) -> CircuitBreaker:
+    """Return the circuit breaker for a source, creating it on first use"""
+    with _breakers_lock:
+        if source_name not in circuit_breakers:
+            circuit_breakers[source_name] = CircuitBreaker()
+        return circuit_breakers[source_name]
+
+
+def breaker_states() -> dict:
+    """Current breaker state of every source that has been fetched"""
+    with _breakers_lock:
+        return {source_name: breaker.state for source_name, breaker in circuit_breakers.items()}
+
+
+class FeedCache:
+    """Thread-safe store of each feed's ETag, Last-Modified and parsed entries, backed by a JSON file"""
+    
+    # Entry fields the search tools read; everything else feedparser produces is dropped
+    ENTRY_FIELDS = ('title', 'link', 'summary', 'published', 'published_parsed')
+    
+    def __init__(self, path: str = FEED_CACHE_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.feeds = self._load()
+    
+    def _load(self) -> dict:
+        """Load the persisted cache, starting empty if it is missing or corrupt"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save(self):
+        """Write the cache atomically so a crash never leaves a half-written file"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.feeds, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+    
+    def conditional_headers(self, rss_url: str) -> dict:
+        """Build If-None-Match / If-Modified-Since headers for a cached feed"""
+        with self.lock:
+            cached = self.feeds.get(rss_url)
+        
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+    
+    def get(self, rss_url: str):
+        """Return the cached feed as a feedparser-style object, or None"""
+        with self.lock:
+            cached = self.feeds.get(rss_url)
+        
+        if not cached:
+            return None
+        return feedparser.FeedParserDict(
+            entries=[feedparser.FeedParserDict(entry) for entry in cached['entries']]
+        )
+    
+    def store(self, rss_url: str, etag: str, last_modified: str, feed):
+        """Remember a freshly downloaded feed and its validators"""
+        entries = []
+        for entry in feed.entries:
+            cached_entry = {field: entry.get(field) for field in self.ENTRY_FIELDS if entry.get(field) is not None}
+            if 'published_parsed' in cached_entry:
+                cached_entry['published_parsed'] = list(cached_entry['published_parsed'])
+            entries.append(cached_entry)
+        
+        with self.lock:
+            self.feeds[rss_url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'entries': entries
+            }
+            try:
+                self._save()
+            except OSError as e:
+                print(f"    ⚠️ Could not persist feed cache: {e}")
+
+
+feed_cache = FeedCache()
+
+
+def fetch_feed(source: NewsSource):
+    """Fetch a feed through the source's circuit breaker, counting errors and slow responses as failures"""
+    breaker = get_breaker(source.name)
+    if not breaker.allow_request():
+        raise SourceUnavailableError(f"circuit open, skipping for up to {breaker.cooldown}s")
+    
+    start_time = time.time()
+    try:
+        feed = _download_feed(source)
+    except Exception:
+        breaker.record_failure()
+        raise
+    
+    elapsed = time.time() - start_time
+    if elapsed > source.timeout * SLOW_RESPONSE_FRACTION:
+        print(f"    🐢 {source.name} responded slowly ({elapsed:.1f}s)")
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    
+    return feed
+
+
+def _download_feed(source: NewsSource):
+    """Download and parse a single RSS feed within the source's timeout, reusing the cache on 304"""
+    print(f"  📰 Fetching {source.name}...")
+    headers = dict(FEED_HEADERS, **feed_cache.conditional_headers(source.url))
+    response = http_client.get(source.url, headers=headers, timeout=source.timeout)
+    
+    if response.status_code == 304:
+        cached_feed = feed_cache.get(source.url)
+        if cached_feed is not None:
+            print(f"    ♻️ {source.name} not modified, using cached entries")
+            cached_feed['not_modified'] = True
+            return cached_feed
+        # Cache was lost between the request and the reply - fetch unconditionally
+        response = http_client.get(source.url, headers=FEED_HEADERS, timeout=source.timeout)
+    
+    response.raise_for_status()
+    feed = parse_feed(response.content, source.entry_cap if USE_FAST_FEED_PARSER else None)
+    
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        feed_cache.store(source.url, etag, last_modified, feed)
+    
+    return feed
+
+
+def iter_fetch_feeds(sources: list, deadline: float = INGESTION_DEADLINE_SECONDS, running: dict = None):
+    """
+    Fetch several RSS feeds concurrently, yielding each one as soon as it arrives
+
+    Args:
+        sources: List of NewsSource entries to fetch
+        deadline: Seconds to wait for all feeds; slower ones are left running and yielded as None
+        running: Fetches already in flight for some of the sources (source name -> Future of the feed);
+            these are awaited instead of being fetched a second time
+
+    Yields:
+        (source name, parsed feed) tuples in completion order; the feed is None if the fetch failed,
+        was skipped by its circuit breaker or missed the deadline
+    """
+    running = running or {}
+    futures = {future: source_name for source_name, future in running.items()}
+    futures.update({
+        _feed_executor.submit(fetch_feed, source): source.name
+        for source in sources if source.name not in running
+    })
+
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            source_name = futures[future]
+            try:
+                yield source_name, future.result()
+            except SourceUnavailableError as e:
+                print(f"    ⏸️ Skipping {source_name}: {e}")
+                yield source_name, None
+            except Exception as e:
+                print(f"    ❌ Error with {source_name}: {e}")
+                yield source_name, None
+    except FuturesTimeoutError:
+        for future, source_name in futures.items():
+            if not future.done():
+                print(f"    ⏱️ {source_name} missed the {deadline}s ingestion deadline, continuing without it")
+                yield source_name, None
+
+
+class ArticleStore:
+    """Thread-safe, in-memory snapshot of the latest parsed feed for every source"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.feeds = {}
+        self.updated_at = {}
+    
+    def update(self, source_name: str, feed):
+        """Replace a source's feed with a freshly polled one, indexing its entries once at ingest time"""
+        if 'token_index' not in feed:
+            feed['token_index'] = FeedIndex(feed.entries)
+        
+        with self.lock:
+            self.feeds[source_name] = feed
+            self.updated_at[source_name] = time.time()
+    
+    def snapshot(self, source_names, max_age: float = None) -> dict:
+        """
+        Read the current feeds for several sources without touching the network
+        
+        Args:
+            source_names: Iterable of source names to read
+            max_age: Sources refreshed longer ago than this (in seconds) are returned as None
+            
+        Returns:
+            Dictionary mapping each source name to its feed, or None if missing or stale
+        """
+        now = time.time()
+        with self.lock:
+            feeds = {}
+            for source_name in source_names:
+                updated_at = self.updated_at.get(source_name)
+                if updated_at is None or (max_age is not None and now - updated_at > max_age):
+                    feeds[source_name] = None
+                else:
+                    feeds[source_name] = self.feeds[source_name]
+            return feeds
+    
+    def freshness(self) -> dict:
+        """Last refresh time of every source as an ISO timestamp"""
+        with self.lock:
+            return {
+                source_name: datetime.fromtimestamp(updated_at).isoformat()
+                for source_name, updated_at in self.updated_at.items()
+            }
+
+
+class FeedPoller:
+    """Background thread that refreshes every source into the article store on its own schedule"""
+    
+    def __init__(self, store: ArticleStore):
+        self.store = store
+        self.sources = {}
+        self.next_due = {}
+        self.in_flight = {}
+        self.lock = threading.Lock()
+        self.thread = None
+        self.pid = None
+    
+    def add_sources(self, sources: list):
+        """Register NewsSource entries to poll; new sources are due immediately"""
+        with self.lock:
+            for source in sources:
+                self.sources[source.name] = source
+                self.next_due.setdefault(source.name, 0)
+    
+    def ensure_started(self):
+        """Start the polling thread once per process (safe to call on every request and after a fork)"""
+        if self.thread is not None and self.thread.is_alive() and self.pid == os.getpid():
+            return
+        
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive() and self.pid == os.getpid():
+                return
+            self.pid = os.getpid()
+            self.in_flight = {}
+            self.thread = threading.Thread(target=self._run, name="feed-poller", daemon=True)
+            self.thread.start()
+        print(f"🔄 Feed poller started for {len(self.sources)} sources")
+    
+    def in_flight_polls(self, source_names) -> dict:
+        """Polls currently running for any of these sources (source name -> Future of the fetched feed or None)"""
+        with self.lock:
+            return {name: self.in_flight[name] for name in source_names if name in self.in_flight}
+    
+    def _run(self):
+        while True:
+            now = time.time()
+            with self.lock:
+                due = [
+                    source for source in self.sources.values()
+                    if self.next_due[source.name] <= now and source.name not in self.in_flight
+                ]
+                for source in due:
+                    self.in_flight[source.name] = _feed_executor.submit(self._poll_source, source)
+            
+            time.sleep(POLL_TICK_SECONDS)
+    
+    def _poll_source(self, source: NewsSource):
+        """Fetch and ingest one source; returns the feed (None if the poll failed) for requests waiting on it"""
+        try:
+            feed = fetch_feed(source)
+            ingest_feed(source, feed)
+            return feed
+        except SourceUnavailableError as e:
+            print(f"    ⏸️ Poll skipped {source.name}: {e}")
+        except Exception as e:
+            print(f"    ❌ Poll error with {source.name}: {e}")
+        finally:
+            with self.lock:
+                self.next_due[source.name] = time.time() + source.poll_interval
+                self.in_flight.pop(source.name, None)
+        return None
+
+
+article_store = ArticleStore()
+feed_poller = FeedPoller(article_store)
+
+
+def ingest_feed(source: NewsSource, feed):
+    """Publish a freshly fetched feed to the article store and append its new entries to the archive"""
+    article_store.update(source.name, feed)
+    
+    # A 304 carries nothing the archive hasn't already seen
+    if feed.get('not_modified'):
+        return
+    
+    try:
+        added, updated_urls = article_archive.append(source, feed.entries)
+        if added:
+            print(f"    🗄️ Archived {added} new articles from {source.name}")
+    except sqlite3.Error as e:
+        print(f"    ⚠️ Could not archive {source.name}: {e}")
+        return
+    
+    # Updated stories must be re-fetched rather than served from the content cache
+    for url in updated_urls:
+        if content_cache.invalidate(url):
+            print(f"    🧹 {source.name} updated a story, dropped cached content for {url[:60]}")
+
+
+def iter_feeds(sources: list, max_age: float = FEED_MAX_AGE_SECONDS):
+    """
+    Read feeds from the warm article store, fetching inline only the sources that are missing or stale
+    
+    Args:
+        sources: List of NewsSource entries to read
+        max_age: Maximum acceptable age of stored feeds in seconds
+        
+    Yields:
+        (source name, parsed feed) tuples: warm sources first, then inline fetches as they complete.
+        A source that is down yields its last known entries, however old, or None
+    """
+    feeds = article_store.snapshot([source.name for source in sources], max_age=max_age)
+    
+    for source in sources:
+        if feeds[source.name] is not None:
+            yield source.name, feeds[source.name]
+    
+    missing = [source for source in sources if feeds[source.name] is None]
+    if not missing:
+        return
+    
+    # Sources the poller is already fetching (e.g. right after start-up) are awaited, not downloaded twice
+    polling = feed_poller.in_flight_polls([source.name for source in missing])
+    print(f"  ⏳ {len(missing)} sources not warm yet, fetching {len(missing) - len(polling)} inline "
+          f"and waiting for {len(polling)} polls in flight...")
+    sources_by_name = {source.name: source for source in missing}
+    for source_name, feed in iter_fetch_feeds(missing, running=polling):
+        if feed is None:
+            feed = article_store.snapshot([source_name])[source_name]
+            if feed is not None:
+                print(f"  🕰️ Using last known entries for {source_name}")
+        elif source_name not in polling:
+            # The poller ingests what it fetched itself
+            ingest_feed(sources_by_name[source_name], feed)
+        yield source_name, feed
+
+
+def match_feed_entries(source: NewsSource, feed, keywords: list, cutoff_time: datetime) -> list:
+    """Return the feed's entries (within the source's cap) that match a keyword and were published after the cutoff"""
+    articles = []
+    token_index = feed.get('token_index') or FeedIndex(feed.entries)
+    matching_positions = token_index.lookup(keywords)
+    
+    for position, entry in enumerate(feed.entries[:source.entry_cap]):
+        if position in matching_positions:
+            
+            pub_date = None
+            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                pub_date = datetime(*entry.published_parsed[:6])
+            
+            if pub_date and pub_date >= cutoff_time:
+                articles.append({
+                    'title': entry.get('title', 'No title'),
+                    'url': entry.get('link', ''),
+                    'source': source.name,
+                    'summary': entry.get('summary', 'No summary')[:500],
+                    'published': pub_date.isoformat(),
+                    'category': source.category
+                })
+    
+    return articles
+
+
+def iter_source_articles(sources: list, query: str, hours_back: int = 24, extra_keywords=()):
+    """
+    Search sources one feed at a time, yielding matches as soon as each feed is available
+    
+    Args:
+        sources: List of NewsSource entries to search
+        query: Search keywords matched against titles and summaries
+        hours_back: How many hours back to search for articles
+        extra_keywords: Additional keywords that always count as a match
+        
+    Yields:
+        (source name, list of matching article dictionaries) tuples
+    """
+    keywords = query.split() + list(extra_keywords)
+    cutoff_time = datetime.now() - timedelta(hours=hours_back)
+    sources_by_name = {source.name: source for source in sources}
+    
+    for source_name, feed in iter_feeds(sources):
+        if feed is None:
+            continue
+        
+        try:
+            articles = match_feed_entries(sources_by_name[source_name], feed, keywords, cutoff_time)
+            print(f"    ✅ Found articles from {source_name}")
+        except Exception as e:
+            print(f"    ❌ Error with {source_name}: {e}")
+            continue
+        
+        yield source_name, articles
+
+
+def rank_articles(articles: list, limit: int = 10, sources: list = None) -> list:
+    """
+    Sort articles newest first, drop syndicated duplicates and keep the top `limit`
+    
+    Args:
+        articles: Article dictionaries, in any order (feeds are collected as they arrive)
+        limit: Maximum number of articles to return
+        sources: The searched NewsSource entries; articles published at the same time keep their sources'
+            registry order (then feed order), so results and the copy deduplication keeps don't depend on timing
+    """
+    registry_position = {source.name: position for position, source in enumerate(sources or [])}
+    # Stable sorts: registry order first, then newest first with ties left in registry order
+    articles = sorted(articles, key=lambda x: registry_position.get(x['source'], len(registry_position)))
+    articles = sorted(articles, key=lambda x: x['published'], reverse=True)
+    
+    # Syndicated copies would otherwise take several of the top slots
+    return deduplicate_articles(articles)[:limit]
+
+
+def search_news(sources: list, query: str, hours_back: int = 24, extra_keywords=(), limit: int = 10) -> list:
+    """
+    Search recent articles across several sources
+    
+    Args:
+        sources: List of NewsSource entries to search
+        query: Search keywords matched against titles and summaries
+        hours_back: How many hours back to search for articles
+        extra_keywords: Additional keywords that always count as a match
+        limit: Maximum number of articles to return
+        
+    Returns:
+        List of article dictionaries (title, url, source, summary, published, category), newest first
+    """
+    if hours_back > LIVE_WINDOW_HOURS:
+        try:
+            archived_articles = article_archive.search(
+                [source.name for source in sources],
+                query.split() + list(extra_keywords),
+                hours_back,
+                limit=limit * 3
+            )
+            if archived_articles:
+                print(f"    🗄️ Answered from archive ({len(archived_articles)} articles in the last {hours_back}h)")
+                return rank_articles(archived_articles, limit, sources)
+        except sqlite3.Error as e:
+            print(f"    ⚠️ Archive search failed, using live feeds: {e}")
+    
+    all_articles = []
+    for _, articles in iter_source_articles(sources, query, hours_back, extra_keywords):
+        all_articles.extend(articles)
+    
+    return rank_articles(all_articles, limit, sources)
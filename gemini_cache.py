@@ -0,0 +1,37 @@
+"""
+Content-addressed cache of Gemini responses
+Identical (model, prompt, generation settings) requests are answered from memory or disk instead of spending quota
+"""
+
+import hashlib
+import json
+import os
+
+from disk_cache import TwoTierCache
+
+GEMINI_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "gemini_responses")
+GEMINI_CACHE_TTL_SECONDS = 12 * 3600
+GEMINI_CACHE_MEMORY_ITEMS = 128
+GEMINI_CACHE_MAX_DISK_BYTES = 100 * 1024 * 1024
+
+
+def response_key(model_name: str, prompt: str, settings: dict = None) -> str:
+    """SHA-256 of everything that determines a response: model, prompt and generation settings"""
+    material = json.dumps(
+        {'model': model_name, 'prompt': prompt, 'settings': settings or {}},
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class GeminiResponseCache(TwoTierCache):
+    """Thread-safe LRU + compressed disk cache of Gemini response texts, keyed by response_key"""
+
+    name = 'Gemini response cache'
+
+    def __init__(self, directory: str = GEMINI_CACHE_DIR, ttl: float = GEMINI_CACHE_TTL_SECONDS,
+                 memory_items: int = GEMINI_CACHE_MEMORY_ITEMS, max_disk_bytes: int = GEMINI_CACHE_MAX_DISK_BYTES):
+        super().__init__(directory, ttl, memory_items, max_disk_bytes)
+
+
+gemini_response_cache = GeminiResponseCache()
@@ -0,0 +1,153 @@
+"""
+Client-side Gemini quota management
+Token buckets for requests and tokens per minute, retry/backoff policy and structured errors for DirectGeminiModel
+"""
+
+import os
+import random
+import threading
+import time
+
+try:
+    from google.api_core import exceptions as google_exceptions
+except ImportError:
+    google_exceptions = None
+
+from content_condenser import estimate_tokens
+
+# Per-minute quota to stay under (defaults fit a paid gemini-1.5-flash key; lower them for a free-tier key)
+GEMINI_REQUESTS_PER_MINUTE = int(os.environ.get('GEMINI_REQUESTS_PER_MINUTE', 60))
+GEMINI_TOKENS_PER_MINUTE = int(os.environ.get('GEMINI_TOKENS_PER_MINUTE', 1_000_000))
+
+# Output tokens charged up front for every request (per pair for batched prompts), on top of the prompt estimate,
+# and the most a single reply can contain (gemini-1.5-flash)
+GEMINI_OUTPUT_TOKEN_ALLOWANCE = 1500
+GEMINI_MAX_OUTPUT_TOKENS = 8192
+
+# Retries for rate limits and transient server errors: full-jitter exponential backoff
+GEMINI_MAX_ATTEMPTS = 4
+GEMINI_BACKOFF_BASE_SECONDS = 1.0
+GEMINI_BACKOFF_MAX_SECONDS = 30.0
+
+
+class GeminiError(Exception):
+    """A Gemini call that failed for good, with enough structure for callers and the UI to act on"""
+
+    def __init__(self, kind: str, message: str, retryable: bool = False, attempts: int = 1):
+        super().__init__(message)
+        self.kind = kind
+        self.message = message
+        self.retryable = retryable
+        self.attempts = attempts
+
+    def to_dict(self) -> dict:
+        return {'error_type': self.kind, 'message': self.message, 'retryable': self.retryable, 'attempts': self.attempts}
+
+
+def classify_error(error: Exception) -> tuple:
+    """
+    Map an exception from generate_content to (kind, retryable)
+
+    kinds: 'rate_limited' (429 / quota), 'unavailable' (5xx, timeouts), 'invalid_request' (4xx),
+    'blocked' (no text returned, e.g. safety filters) and 'unknown'
+    """
+    if google_exceptions is not None:
+        if isinstance(error, (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)):
+            return 'rate_limited', True
+        if isinstance(error, (google_exceptions.ServiceUnavailable, google_exceptions.InternalServerError,
+                              google_exceptions.DeadlineExceeded, google_exceptions.GatewayTimeout)):
+            return 'unavailable', True
+        if isinstance(error, google_exceptions.ClientError):
+            return 'invalid_request', False
+    if isinstance(error, ValueError):
+        # response.text raises ValueError when the candidate was blocked or empty
+        return 'blocked', False
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return 'unavailable', True
+    return 'unknown', False
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff before retry number `attempt` (1-based)"""
+    return random.uniform(0, min(GEMINI_BACKOFF_MAX_SECONDS, GEMINI_BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+class GeminiRateLimiter:
+    """Thread-safe request and token buckets refilled continuously at the per-minute quota"""
+
+    def __init__(self, requests_per_minute: int = GEMINI_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: int = GEMINI_TOKENS_PER_MINUTE):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.condition = threading.Condition()
+        self.request_tokens = float(requests_per_minute)
+        self.quota_tokens = float(tokens_per_minute)
+        self.refilled_at = time.monotonic()
+        self.paused_until = 0.0
+        self.counters = {'requests': 0, 'throttled': 0, 'seconds_throttled': 0.0, 'server_rate_limits': 0}
+
+    def _refill(self, now: float):
+        elapsed = now - self.refilled_at
+        self.request_tokens = min(self.requests_per_minute, self.request_tokens + elapsed * self.requests_per_minute / 60)
+        self.quota_tokens = min(self.tokens_per_minute, self.quota_tokens + elapsed * self.tokens_per_minute / 60)
+        self.refilled_at = now
+
+    def acquire(self, prompt: str, output_tokens: int = GEMINI_OUTPUT_TOKEN_ALLOWANCE) -> float:
+        """
+        Block until one request and the prompt's estimated tokens fit in the per-minute budget, then take them
+
+        Args:
+            prompt: Prompt text (its tokens are estimated)
+            output_tokens: Reply tokens to charge up front
+
+        Returns:
+            Seconds spent waiting
+        """
+        # A single prompt larger than the whole minute's budget still goes through once the bucket is full
+        cost = min(estimate_tokens(prompt) + output_tokens, self.tokens_per_minute)
+        started = time.monotonic()
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.paused_until and self.request_tokens >= 1 and self.quota_tokens >= cost:
+                    break
+                wait = max(
+                    self.paused_until - now,
+                    (1 - self.request_tokens) * 60 / self.requests_per_minute,
+                    (cost - self.quota_tokens) * 60 / self.tokens_per_minute,
+                    0.05
+                )
+                self.condition.wait(wait)
+
+            self.request_tokens -= 1
+            self.quota_tokens -= cost
+            waited = time.monotonic() - started
+            self.counters['requests'] += 1
+            if waited > 0.05:
+                self.counters['throttled'] += 1
+                self.counters['seconds_throttled'] += waited
+            return waited
+
+    def pause(self, seconds: float):
+        """Hold every caller back after the server reported a rate limit, instead of letting them all hit it"""
+        with self.condition:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.request_tokens = 0.0
+            self.counters['server_rate_limits'] += 1
+
+    def stats(self) -> dict:
+        with self.condition:
+            self._refill(time.monotonic())
+            return {
+                'requests_per_minute': self.requests_per_minute,
+                'tokens_per_minute': self.tokens_per_minute,
+                'available_requests': int(self.request_tokens),
+                'available_tokens': int(self.quota_tokens),
+                'paused_for_seconds': round(max(self.paused_until - time.monotonic(), 0), 1),
+                **self.counters,
+                'seconds_throttled': round(self.counters['seconds_throttled'], 2)
+            }
+
+
+gemini_limiter = GeminiRateLimiter()
@@ -0,0 +1,226 @@
+"""
+Article text extraction engines
+An lxml fast path for the common case, with the BeautifulSoup html.parser engine kept as the fallback
+"""
+
+import re
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# Use lxml when it is installed (BeautifulSoup handles anything it can't)
+USE_LXML_EXTRACTOR = True
+
+# Characters of article text extracted per page (extraction stops once it has this much);
+# content_condenser later picks the paragraphs that go into prompts
+ARTICLE_TEXT_CHARS = 12000
+
+# Try to find article content (common selectors)
+CONTENT_SELECTORS = [
+    'article', '.article-body', '.story-body', '.entry-content',
+    '.post-content', '.content', '.article-content', '#article-body',
+    '.article-text', '.story-content', '.post-text'
+]
+
+# Elements that can hold an article body; everything else (head, top-level scripts, nav, footers) is never built
+CONTENT_CONTAINER_TAGS = {'article', 'main', 'section', 'div', 'p'}
+
+# tag, .class and #id combinations - the only selector shapes the strainer and the lxml engine translate
+SIMPLE_SELECTOR = re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)?((?:[.#][\w-]+)+)?$')
+SELECTOR_PART = re.compile(r'([.#])([\w-]+)')
+
+
+class ContentStrainer(SoupStrainer):
+    """
+    Keeps the container tags, the tags the selectors name, and any element carrying one of the selectors'
+    classes or ids ('.story-body' may sit on a <span> or <td>); top-level elements matching none are never built
+    """
+
+    def __init__(self, tags: set, classes: set, ids: set):
+        super().__init__()
+        self.tags = tags
+        self.classes = classes
+        self.ids = ids
+
+    def keeps(self, name: str, attrs) -> bool:
+        if name in self.tags:
+            return True
+        attrs = attrs or {}
+        element_classes = attrs.get('class') or ''
+        if isinstance(element_classes, str):
+            element_classes = element_classes.split()
+        return attrs.get('id') in self.ids or not self.classes.isdisjoint(element_classes)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        """Parse-time hook of bs4 4.13+"""
+        return self.keeps(name, attrs)
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        """Parse-time hook of earlier bs4 releases"""
+        return self.keeps(markup_name, markup_attrs)
+
+
+def content_strainer(selectors: list):
+    """
+    Build a strainer that only parses elements the selectors (or the paragraph fallback) can match
+
+    Args:
+        selectors: CSS selectors that will be tried on the parsed page
+
+    Returns:
+        ContentStrainer, or None if a selector is too complex to strain for (the whole page is parsed then)
+    """
+    tags = set(CONTENT_CONTAINER_TAGS)
+    classes = set()
+    ids = set()
+    for selector in selectors:
+        match = SIMPLE_SELECTOR.match(selector.strip())
+        if not match:
+            return None
+        if match.group(1):
+            tags.add(match.group(1).lower())
+        for kind, name in SELECTOR_PART.findall(match.group(2) or ''):
+            (ids if kind == '#' else classes).add(name)
+    return ContentStrainer(tags, classes, ids)
+
+
+def selector_to_xpath(selector: str):
+    """Translate a simple CSS selector ('article', 'div.story-body', '#main') to XPath, or None if it isn't simple"""
+    match = SIMPLE_SELECTOR.match(selector.strip())
+    if not match:
+        return None
+
+    conditions = []
+    for kind, name in SELECTOR_PART.findall(match.group(2) or ''):
+        if kind == '#':
+            conditions.append(f"@id='{name}'")
+        else:
+            conditions.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')")
+
+    xpath = '//' + (match.group(1).lower() if match.group(1) else '*')
+    if conditions:
+        xpath += '[' + ' and '.join(conditions) + ']'
+    return xpath
+
+
+def collect_text(strings, limit: int = ARTICLE_TEXT_CHARS, separator: str = '') -> str:
+    """Join stripped strings until limit characters have been collected, without walking the rest of the page"""
+    parts = []
+    collected = 0
+    for text in strings:
+        if not text:
+            continue
+        parts.append(text)
+        collected += len(text) + len(separator)
+        if collected >= limit:
+            break
+    return separator.join(parts)
+
+
+def extract_with_bs4(html: bytes, selectors: list, limit: int = ARTICLE_TEXT_CHARS, encoding: str = None) -> tuple:
+    """
+    Extract the article body with BeautifulSoup's html.parser
+
+    Args:
+        html: Raw page HTML
+        selectors: CSS selectors to try, in order
+        limit: Stop collecting text after this many characters
+        encoding: Charset from the HTTP Content-Type header, if it named one (otherwise detected from the page)
+
+    Returns:
+        (article text, selector that matched or None if the paragraph fallback was used)
+    """
+    soup = BeautifulSoup(html, 'html.parser', parse_only=content_strainer(selectors), from_encoding=encoding)
+
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    for selector in selectors:
+        content_div = soup.select_one(selector)
+        if content_div:
+            # One line per paragraph so the condenser can rank them; containers without <p> are taken whole
+            paragraphs = content_div.find_all('p')
+            if paragraphs:
+                article_text = collect_text((p.get_text(strip=True) for p in paragraphs), limit, separator='\n')
+            else:
+                article_text = collect_text(content_div.stripped_strings, limit)
+            if article_text:
+                return article_text, selector
+
+    # Fallback: get all paragraph text
+    paragraphs = (p.get_text(strip=True) for p in soup.find_all('p'))
+    return collect_text(paragraphs, limit, separator='\n'), None
+
+
+def _stripped_strings(element):
+    for text in element.itertext():
+        text = text.strip()
+        if text:
+            yield text
+
+
+def detect_encoding(html: bytes, encoding: str = None):
+    """
+    The page's charset, chosen the way BeautifulSoup does: the header's charset, then a BOM or <meta charset>,
+    then whichever of UTF-8 and Windows-1252 decodes the bytes (lxml alone would assume Latin-1 without a <meta>)
+    """
+    return UnicodeDammit(html, [encoding] if encoding else [], is_html=True).original_encoding
+
+
+def extract_with_lxml(html: bytes, selectors: list, limit: int = ARTICLE_TEXT_CHARS, encoding: str = None) -> tuple:
+    """
+    Extract the article body with lxml (same selector order, encoding detection and output as extract_with_bs4)
+
+    Raises:
+        ValueError: If lxml isn't installed, a selector can't be translated or the page can't be parsed
+    """
+    if lxml_html is None:
+        raise ValueError("lxml is not installed")
+
+    xpaths = [selector_to_xpath(selector) for selector in selectors]
+    if None in xpaths:
+        raise ValueError(f"unsupported selector in {selectors}")
+
+    # lxml only honours <meta charset>; decode the way BeautifulSoup would so both engines see the same text
+    detected = detect_encoding(html, encoding) if isinstance(html, bytes) else None
+    if isinstance(html, bytes) and detected is None:
+        raise ValueError("could not determine the page encoding")
+
+    try:
+        parser = lxml_html.HTMLParser(encoding=detected) if detected else None
+        root = lxml_html.document_fromstring(html, parser=parser)
+    except (LookupError, etree.ParserError, etree.XMLSyntaxError) as e:
+        raise ValueError(f"lxml could not parse the page: {e}") from e
+
+    # Remove script and style elements (and comments, which BeautifulSoup never returns as text)
+    etree.strip_elements(root, 'script', 'style', etree.Comment, with_tail=False)
+
+    for selector, xpath in zip(selectors, xpaths):
+        found = root.xpath(xpath)
+        if found:
+            paragraphs = list(found[0].iter('p'))
+            if paragraphs:
+                article_text = collect_text((''.join(_stripped_strings(p)) for p in paragraphs), limit, separator='\n')
+            else:
+                article_text = collect_text(_stripped_strings(found[0]), limit)
+            if article_text:
+                return article_text, selector
+
+    # Fallback: get all paragraph text
+    paragraphs = (''.join(_stripped_strings(p)) for p in root.iter('p'))
+    return collect_text(paragraphs, limit, separator='\n'), None
+
+
+def extract_text(html: bytes, selectors: list, limit: int = ARTICLE_TEXT_CHARS, encoding: str = None) -> tuple:
+    """Extract with lxml when possible, falling back to BeautifulSoup for anything it can't handle"""
+    if USE_LXML_EXTRACTOR and lxml_html is not None:
+        try:
+            return extract_with_lxml(html, selectors, limit, encoding)
+        except ValueError as e:
+            print(f"↩️ lxml extractor fell back to BeautifulSoup: {e}")
+    return extract_with_bs4(html, selectors, limit, encoding)
@@ -0,0 +1,85 @@
+"""
+Shared pooled HTTP client for the Gaza Media Fact-Check agent
+One set of per-host keep-alive connection pools for feed downloads, article fetches and status probes
+"""
+
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # Includes 'br' when a brotli decoder is installed
+    from urllib3.util.request import ACCEPT_ENCODING
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# Number of hosts to keep pools for, and keep-alive connections per host
+POOL_HOSTS = 64
+POOL_CONNECTIONS_PER_HOST = 8
+
+
+class PooledHttpClient:
+    """Thread-safe HTTP client: per-thread sessions sharing one pooled, keep-alive adapter"""
+
+    def __init__(self, pool_hosts: int = POOL_HOSTS, pool_connections_per_host: int = POOL_CONNECTIONS_PER_HOST):
+        self.pool_hosts = pool_hosts
+        self.pool_connections_per_host = pool_connections_per_host
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        """Create fresh pools (also used after a fork, since sockets must not be shared between processes)"""
+        self.pid = os.getpid()
+        self.adapter = HTTPAdapter(
+            pool_connections=self.pool_hosts,
+            pool_maxsize=self.pool_connections_per_host,
+            max_retries=0
+        )
+        self.local = threading.local()
+
+    def session(self) -> requests.Session:
+        """Return this thread's session, mounted on the shared pooled adapter"""
+        if self.pid != os.getpid():
+            with self.lock:
+                if self.pid != os.getpid():
+                    self._reset()
+
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+            session.mount('http://', self.adapter)
+            session.mount('https://', self.adapter)
+            self.local.session = session
+        return session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the shared pools (same arguments as requests.get)"""
+        return self.session().get(url, **kwargs)
+
+    def stats(self) -> dict:
+        """Per-host connection pool statistics: requests sent, connections opened and connections reused"""
+        pools = self.adapter.poolmanager.pools
+        host_stats = {}
+        for pool_key in pools.keys():
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            host = f"{pool.scheme}://{pool.host}"
+            stats = host_stats.setdefault(host, {'requests': 0, 'connections_opened': 0, 'connections_reused': 0})
+            stats['requests'] += pool.num_requests
+            stats['connections_opened'] += pool.num_connections
+            stats['connections_reused'] += max(pool.num_requests - pool.num_connections, 0)
+
+        total_requests = sum(stats['requests'] for stats in host_stats.values())
+        total_reused = sum(stats['connections_reused'] for stats in host_stats.values())
+        return {
+            'hosts': host_stats,
+            'total_requests': total_requests,
+            'total_connections_reused': total_reused,
+            'reuse_ratio': round(total_reused / total_requests, 3) if total_requests else 0.0
+        }
+
+
+http_client = PooledHttpClient()
@@ -0,0 +1,75 @@
+"""
+Media source registry for the Gaza Media Fact-Check agent
+Every outlet the ingestion engine polls is declared here - add a NewsSource entry to cover a new outlet
+"""
+
+from dataclasses import dataclass
+
+# Defaults for sources that don't override them
+DEFAULT_ENTRY_CAP = 10
+DEFAULT_TIMEOUT_SECONDS = 10
+DEFAULT_POLL_INTERVAL_SECONDS = 300
+
+# Topic keywords always matched for a side, in addition to the caller's query
+SIDE_KEYWORDS = {
+    'western': [],
+    'arabic': ['غزة', 'إسرائيل', 'فلسطين', 'gaza', 'israel', 'palestine']
+}
+
+
+@dataclass(frozen=True)
+class NewsSource:
+    """A single RSS outlet, its ingestion budget and (optionally) where its article text lives"""
+    name: str
+    url: str
+    language: str
+    side: str
+    entry_cap: int = DEFAULT_ENTRY_CAP
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+    poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS
+    # Domains the outlet's article links point to, and the CSS selector of its article body there
+    article_domains: tuple = ()
+    content_selector: str = None
+
+    @property
+    def category(self) -> str:
+        """Article category label used in search results (e.g. 'western_media')"""
+        return f"{self.side}_media"
+
+
+NEWS_SOURCES = [
+    # Western media
+    NewsSource("CNN", "http://rss.cnn.com/rss/edition.rss", "en", "western"),
+    NewsSource("BBC", "http://feeds.bbci.co.uk/news/world/middle_east/rss.xml", "en", "western",
+               article_domains=("bbc.com", "bbc.co.uk"), content_selector="article"),
+    NewsSource("Reuters", "https://feeds.reuters.com/reuters/worldNews", "en", "western",
+               timeout=5, poll_interval=600),
+    NewsSource("AP News", "https://feeds.apnews.com/rss/apf-topnews", "en", "western",
+               timeout=5, poll_interval=600),
+    NewsSource("Guardian", "https://www.theguardian.com/world/middleeast/rss", "en", "western",
+               article_domains=("theguardian.com",), content_selector="#maincontent"),
+    NewsSource("Washington Post", "https://feeds.washingtonpost.com/rss/world", "en", "western"),
+    NewsSource("New York Times", "https://rss.nytimes.com/services/xml/rss/nyt/World.xml", "en", "western"),
+
+    # Arabic media
+    NewsSource("Al Jazeera Arabic", "https://www.aljazeera.net/rss/all.xml", "ar", "arabic", entry_cap=15,
+               article_domains=("aljazeera.net",), content_selector=".wysiwyg"),
+    NewsSource("BBC Arabic", "https://feeds.bbci.co.uk/arabic/rss.xml", "ar", "arabic", entry_cap=15),
+    NewsSource("RT Arabic", "https://arabic.rt.com/rss/", "ar", "arabic", entry_cap=15),
+    NewsSource("Sky News Arabic", "https://www.skynewsarabia.com/rss.xml", "ar", "arabic", entry_cap=15),
+    NewsSource("Al Arabiya", "https://www.alarabiya.net/ar/rss.xml", "ar", "arabic", entry_cap=15),
+]
+
+
+def get_sources(side: str = None) -> list:
+    """Return the registered sources, optionally only those on one side ('western' or 'arabic')"""
+    return [source for source in NEWS_SOURCES if side is None or source.side == side]
+
+
+def declared_content_selectors() -> dict:
+    """Map each declared article domain to its source's content selector"""
+    return {
+        domain: source.content_selector
+        for source in NEWS_SOURCES if source.content_selector
+        for domain in source.article_domains
+    }